@@ -0,0 +1,123 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from uuid import uuid4
+import asyncio
+import json
+import threading
+import weakref
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.utils.log import logger
+from openai import AsyncOpenAI, OpenAI
+
+
+class OpenAIClientPool:
+    def __init__(self):
+        self._clients: Dict[str, OpenAI] = {}
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def client(self, client_params: dict) -> OpenAI:
+        key = self._key(client_params)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = OpenAI(**client_params)
+                self._clients[key] = client
+                logger.debug("🔌 Yeni OpenAI istemcisi açıldı")
+            return client
+
+    def async_client(self, client_params: dict) -> AsyncOpenAI:
+        # httpx async connections belong to the event loop that opened them, and
+        # the Streamlit tabs run every request on a fresh loop, so async clients
+        # are shared per loop and dropped together with it.
+        loop = asyncio.get_running_loop()
+        key = self._key(client_params)
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = AsyncOpenAI(**client_params)
+                clients[key] = client
+                logger.debug("🔌 Yeni asenkron OpenAI istemcisi açıldı")
+            return client
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    def _key(self, client_params: dict) -> str:
+        return json.dumps(client_params, sort_keys=True, default=str)
+
+
+openai_clients = OpenAIClientPool()
+
+
+@dataclass
+class PooledOpenAIChat(OpenAIChat):
+    # agno builds a new OpenAI client (and connection pool) for every model
+    # call; this model reuses one client per API key/base URL instead.
+    def get_client(self) -> OpenAI:
+        if self.http_client:
+            return super().get_client()
+        return openai_clients.client(self._get_client_params())
+
+    def get_async_client(self) -> AsyncOpenAI:
+        if self.http_client:
+            return super().get_async_client()
+        return openai_clients.async_client(self._get_client_params())
+
+
+class AgentPool:
+    def __init__(self, max_idle: int = 4):
+        self.max_idle = max_idle
+        self._idle: Dict[str, List[Agent]] = {}
+        self._lock = threading.Lock()
+
+    def checkout(self, name: str, factory: Callable[[], Agent], session_id: Optional[str] = None) -> Agent:
+        agent = self._take_idle(name) or factory()
+        return self._isolate(agent, session_id)
+
+    async def acheckout(self, name: str, factory: Callable[[], Awaitable[Agent]], session_id: Optional[str] = None) -> Agent:
+        agent = self._take_idle(name) or await factory()
+        return self._isolate(agent, session_id)
+
+    def release(self, name: str, agent: Agent) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(name, [])
+            if len(idle) < self.max_idle and all(idle_agent is not agent for idle_agent in idle):
+                idle.append(agent)
+
+    @asynccontextmanager
+    async def session(self, name: str, factory: Callable[[], Awaitable[Agent]], session_id: Optional[str] = None) -> AsyncIterator[Agent]:
+        agent = await self.acheckout(name, factory, session_id)
+        try:
+            yield agent
+        finally:
+            self.release(name, agent)
+
+    def _take_idle(self, name: str) -> Optional[Agent]:
+        with self._lock:
+            idle = self._idle.get(name)
+            return idle.pop() if idle else None
+
+    def _isolate(self, agent: Agent, session_id: Optional[str]) -> Agent:
+        # Toolkits and the model client are reused; conversation state is not.
+        # A checked-out agent starts a new session with empty memory, so nothing
+        # from the previous user or workflow reaches the next prompt.
+        agent.reset_session()
+        agent.reset_run_state()
+        agent.session_id = session_id or str(uuid4())
+        agent.memory = None
+        agent.team_id = None
+        agent.team_session_id = None
+        agent.team_session_state = None
+        agent.workflow_session_state = None
+        return agent
+
+
+agent_pool = AgentPool()
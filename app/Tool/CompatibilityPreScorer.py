@@ -0,0 +1,291 @@
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+import re
+
+from Tool.KeywordMatcher import TURKISH_I_FOLD
+
+
+def normalize_text(text: str) -> str:
+    return text.translate(TURKISH_I_FOLD).lower() if ("İ" in text or "ı" in text) else text.lower()
+
+
+def _normalize_terms(terms: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(normalize_text(term) for term in terms)
+
+
+def _normalize_groups(groups: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, ...]]:
+    return {name: _normalize_terms(terms) for name, terms in groups.items()}
+
+
+SCORE_WEIGHTS = {
+    "technical_skills_score": 0.25,
+    "experience_score": 0.25,
+    "education_score": 0.15,
+    "sector_experience_score": 0.15,
+    "language_skills_score": 0.10,
+    "soft_skills_score": 0.10,
+}
+NEUTRAL_SCORE = 5.0
+
+JOB_SKILL_FIELDS = ("key_technologies", "tech_stack", "technologies", "skills")
+JOB_EXPERIENCE_FIELDS = ("years_of_experience", "experience_required", "experience_level", "job_level")
+JOB_TITLE_FIELDS = ("job_title", "position_details", "position", "title")
+
+EDUCATION_LEVELS = [(level, _normalize_terms(terms)) for level, terms in [
+    (5, ("doktora", "phd", "ph.d", "doctorate")),
+    (4, ("yüksek lisans", "master", "msc", "m.sc", "mba")),
+    (3, ("lisans", "bachelor", "üniversite", "university", "bsc", "b.sc", "mühendislik fakültesi")),
+    (2, ("ön lisans", "önlisans", "associate")),
+    (1, ("lise", "high school")),
+]]
+# "lisans" is also part of "yüksek lisans" and "ön lisans", so each level is
+# matched with the longer degree names of the other levels blanked out.
+EDUCATION_SHADOWS = {
+    level: tuple(
+        other for other_level, others in EDUCATION_LEVELS if other_level != level
+        for other in others if any(term != other and term in other for term in terms)
+    )
+    for level, terms in EDUCATION_LEVELS
+}
+SENIORITY_YEARS = [(_normalize_terms(terms), years) for terms, years in [
+    (("director", "direktör", "head of"), 10),
+    (("lead", "principal", "staff", "lider"), 7),
+    (("senior", "kıdemli", "sr."), 5),
+    (("mid-level", "mid level", "orta seviye"), 3),
+    (("junior", "jr.", "entry level", "giriş seviyesi", "stajyer", "intern"), 0),
+]]
+SECTORS = _normalize_groups({
+    "finans": ("finans", "finance", "fintech", "banka", "bank", "ödeme", "payment"),
+    "sigorta": ("sigorta", "insurance", "insurtech"),
+    "e-ticaret": ("e-ticaret", "e-commerce", "ecommerce", "marketplace", "pazaryeri"),
+    "perakende": ("perakende", "retail"),
+    "sağlık": ("sağlık", "health", "healthcare", "medikal", "medical", "hastane", "ilaç", "pharma"),
+    "eğitim": ("edtech", "eğitim teknolojileri", "education technology"),
+    "oyun": ("oyun", "gaming", "game studio"),
+    "telekom": ("telekom", "telecom", "telekomünikasyon", "telecommunication"),
+    "savunma": ("savunma", "defense", "defence", "havacılık", "aerospace"),
+    "otomotiv": ("otomotiv", "automotive"),
+    "lojistik": ("lojistik", "logistics", "kargo", "supply chain", "tedarik zinciri"),
+    "enerji": ("enerji", "energy"),
+    "medya": ("medya", "media", "reklam", "advertising"),
+})
+LANGUAGES = _normalize_groups({
+    "ingilizce": ("ingilizce", "english"),
+    "türkçe": ("türkçe", "turkish"),
+    "almanca": ("almanca", "german", "deutsch"),
+    "fransızca": ("fransızca", "french"),
+    "ispanyolca": ("ispanyolca", "spanish"),
+    "arapça": ("arapça", "arabic"),
+    "rusça": ("rusça", "russian"),
+})
+SOFT_SKILLS = _normalize_groups({
+    "takım çalışması": ("takım çalışması", "teamwork", "team player", "collaborat", "işbirliği"),
+    "iletişim": ("iletişim", "communication"),
+    "liderlik": ("liderlik", "leadership", "lead a team"),
+    "problem çözme": ("problem çözme", "problem solving", "problem-solving"),
+    "analitik düşünme": ("analitik", "analytical"),
+    "mentorluk": ("mentorluk", "mentoring", "mentor"),
+    "zaman yönetimi": ("zaman yönetimi", "time management", "deadline"),
+    "koordinasyon": ("koordinasyon", "coordination", "cross-functional"),
+    "proje yönetimi": ("proje yönetimi", "project management"),
+})
+MONTHS = {
+    "oca": 1, "jan": 1, "şub": 2, "feb": 2, "mar": 3, "nis": 4, "apr": 4, "may": 5, "haz": 6, "jun": 6,
+    "tem": 7, "jul": 7, "ağu": 8, "aug": 8, "eyl": 9, "sep": 9, "eki": 10, "oct": 10, "kas": 11, "nov": 11,
+    "ara": 12, "dec": 12,
+}
+ONGOING_MARKERS = ("günümüz", "halen", "devam", "present", "current", "now", "şu an")
+
+YEARS_PATTERN = re.compile(r"(\d+(?:[.,]\d+)?)\s*\+?\s*(?:-\s*\d+\s*)?(?:yil|sene|years?|yrs?)")
+DATE_PATTERN = re.compile(r"(?:([a-zçğıöşü]{3})[a-zçğıöşü]*\.?\s+)?((?:19|20)\d{2})")
+
+
+@lru_cache(maxsize=4096)
+def _term_pattern(term: str) -> re.Pattern:
+    return re.compile(rf"(?<!\w){re.escape(term)}(?!\w)")
+
+
+def contains_term(text: str, term: str) -> bool:
+    return bool(term) and _term_pattern(term).search(text) is not None
+
+
+def flatten_text(data: Any) -> str:
+    if isinstance(data, dict):
+        return " ".join(flatten_text(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return " ".join(flatten_text(item) for item in data)
+    return str(data) if data is not None else ""
+
+
+def as_list(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return [part.strip() for part in re.split(r"[,;/\n]", value) if part.strip()]
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if isinstance(item, (str, int, float)) and str(item).strip()]
+    return []
+
+
+def _matching_groups(text: str, groups: Dict[str, Tuple[str, ...]]) -> Set[str]:
+    return {name for name, terms in groups.items() if any(term in text for term in terms)}
+
+
+def education_level(text: str, match: Callable[[str, str], bool]) -> int:
+    for level, terms in EDUCATION_LEVELS:
+        masked = text
+        for phrase in EDUCATION_SHADOWS[level]:
+            masked = masked.replace(phrase, " ")
+        if any(match(masked, term) for term in terms):
+            return level
+    return 0
+
+
+def extract_jobs(job_data: Any) -> List[Tuple[str, dict]]:
+    if isinstance(job_data, dict) and isinstance(job_data.get("results"), list):
+        items = job_data["results"]
+    elif isinstance(job_data, dict) and isinstance(job_data.get("result"), list):
+        items = job_data["result"]
+    elif isinstance(job_data, list):
+        items = job_data
+    elif isinstance(job_data, dict) and any(field in job_data for field in JOB_SKILL_FIELDS + JOB_TITLE_FIELDS):
+        items = [job_data]
+    elif isinstance(job_data, dict):
+        return [(str(title), details) for title, details in job_data.items() if isinstance(details, dict)]
+    else:
+        return []
+
+    jobs = []
+    for index, job in enumerate(items):
+        if not isinstance(job, dict):
+            continue
+        label = next((str(job[field]).split(",")[0].strip() for field in JOB_TITLE_FIELDS if job.get(field)), f"İş {index + 1}")
+        jobs.append((label, job))
+    return jobs
+
+
+class CandidateProfile:
+    def __init__(self, resume: dict):
+        resume = resume if isinstance(resume, dict) else {}
+        skills = resume.get("skills") if isinstance(resume.get("skills"), dict) else {}
+        projects = [project for project in resume.get("projects", []) if isinstance(project, dict)]
+        experience = [job for job in resume.get("experience", []) if isinstance(job, dict)]
+
+        self.text = normalize_text(flatten_text(resume))
+        self.skills = {normalize_text(skill) for skill in as_list(skills.get("technical"))}
+        for project in projects:
+            self.skills.update(normalize_text(skill) for skill in as_list(project.get("technologies")))
+        self.positions = normalize_text(" ".join(str(job.get("position", "")) for job in experience))
+        self.years = self._total_years(experience)
+        self.education_level = max(
+            [self._education_level(normalize_text(flatten_text(entry))) for entry in resume.get("education", []) or []] + [0]
+        )
+        self.languages = _matching_groups(normalize_text(flatten_text(resume.get("languages", []))), LANGUAGES)
+        self.sectors = _matching_groups(normalize_text(flatten_text(experience)), SECTORS)
+        self.soft_skills = _matching_groups(self.text, SOFT_SKILLS)
+
+    def _total_years(self, experience: List[dict]) -> float:
+        months = 0
+        for job in experience:
+            span = self._period_months(normalize_text(str(job.get("period", ""))))
+            months += span or 0
+        return round(months / 12, 1)
+
+    def _period_months(self, period: str) -> Optional[int]:
+        dates = [(MONTHS.get(month or "", 1 if index == 0 else 12), int(year))
+                 for index, (month, year) in enumerate(DATE_PATTERN.findall(period))]
+        if not dates:
+            return None
+        start = dates[0]
+        if len(dates) > 1:
+            end = dates[-1]
+        elif any(marker in period for marker in ONGOING_MARKERS):
+            end = (date.today().month, date.today().year)
+        else:
+            return 12
+        return max(1, (end[1] - start[1]) * 12 + end[0] - start[0] + 1)
+
+    def _education_level(self, text: str) -> int:
+        return education_level(text, lambda text, term: term in text)
+
+
+class CompatibilityPreScorer:
+    def score(self, job: dict, resume: Any) -> Dict[str, Any]:
+        profile = resume if isinstance(resume, CandidateProfile) else CandidateProfile(resume)
+        job_text = normalize_text(flatten_text(job))
+
+        sub_scores = {
+            "technical_skills_score": self._technical_score(job, profile),
+            "experience_score": self._experience_score(job, job_text, profile),
+            "education_score": self._education_score(job_text, profile),
+            "sector_experience_score": self._overlap_score(_matching_groups(job_text, SECTORS), profile.sectors),
+            "language_skills_score": self._overlap_score(_matching_groups(job_text, LANGUAGES), profile.languages),
+            "soft_skills_score": self._overlap_score(_matching_groups(job_text, SOFT_SKILLS), profile.soft_skills),
+        }
+        overall = sum(sub_scores[name] * weight for name, weight in SCORE_WEIGHTS.items())
+        return {"overall_score": round(overall, 1), **{name: round(value, 1) for name, value in sub_scores.items()}}
+
+    def rank(self, job_data: Any, resume: dict) -> List[Dict[str, Any]]:
+        profile = CandidateProfile(resume)
+        ranking = [
+            {"job_index": index, "job_title": label, **self.score(job, profile)}
+            for index, (label, job) in enumerate(extract_jobs(job_data))
+        ]
+        ranking.sort(key=lambda entry: -entry["overall_score"])
+        return ranking
+
+    def shortlist(self, job_data: Any, resume: dict, top_k: int = 5) -> List[Dict[str, Any]]:
+        return self.rank(job_data, resume)[:max(0, top_k)]
+
+    def _technical_score(self, job: dict, profile: CandidateProfile) -> float:
+        required = []
+        for field in JOB_SKILL_FIELDS:
+            required.extend(normalize_text(skill) for skill in as_list(job.get(field)))
+        required = [skill for skill in dict.fromkeys(required) if "belirtilmemiş" not in skill]
+        if not required:
+            return NEUTRAL_SCORE
+
+        credit = 0.0
+        for skill in required:
+            if skill in profile.skills or any(contains_term(known, skill) or contains_term(skill, known) for known in profile.skills):
+                credit += 1.0
+            elif contains_term(profile.text, skill):
+                # Mentioned in experience or projects but not listed as a skill.
+                credit += 0.5
+        return 10 * credit / len(required)
+
+    def _experience_score(self, job: dict, job_text: str, profile: CandidateProfile) -> float:
+        required = self._required_years(job)
+        years_score = NEUTRAL_SCORE if required is None else (10.0 if profile.years >= required else 10 * profile.years / required)
+
+        title = next((normalize_text(str(job[field])) for field in JOB_TITLE_FIELDS if job.get(field)), "")
+        title_words = re.findall(r"\w{3,}", title.split(",")[0])
+        if not title_words or not profile.positions:
+            return years_score
+        title_score = 10 * sum(contains_term(profile.positions, word) for word in title_words) / len(title_words)
+        return 0.7 * years_score + 0.3 * title_score
+
+    def _required_years(self, job: dict) -> Optional[float]:
+        for field in JOB_EXPERIENCE_FIELDS:
+            text = normalize_text(str(job.get(field) or ""))
+            match = YEARS_PATTERN.search(text) or re.fullmatch(r"\s*(\d+)\s*\+?\s*", text)
+            if match:
+                return float(match.group(1).replace(",", "."))
+            for terms, years in SENIORITY_YEARS:
+                if any(term in text for term in terms):
+                    return float(years)
+        return None
+
+    def _education_score(self, job_text: str, profile: CandidateProfile) -> float:
+        required = education_level(job_text, contains_term)
+        if not required:
+            return NEUTRAL_SCORE
+        return min(10.0, 10 * profile.education_level / required)
+
+    def _overlap_score(self, required: Iterable[str], offered: Set[str]) -> float:
+        required = set(required)
+        if not required:
+            return NEUTRAL_SCORE
+        return 10 * len(required & offered) / len(required)
+
+
+pre_scorer = CompatibilityPreScorer()
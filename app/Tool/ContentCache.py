@@ -1,22 +1,288 @@
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any, Dict, Optional
+import json
+import os
+import sqlite3
+import sys
+import threading
 import time
+import zlib
+import dotenv
+dotenv.load_dotenv()
+
 
 class ContentCache:
-    def __init__(self, ttl: int = 3600):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self,
+                 ttl: int = 3600,
+                 max_entries: int = 1024,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 sweep_interval: int = 60):
         self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._expiry: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._last_sweep = time.time()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+
+    def set(self, key: str, data: Any, expires_at: Optional[float] = None) -> None:
+        size = self._estimate_size(data)
+        if size > self.max_bytes:
+            # Too large to keep, but an older value under this key is stale now.
+            with self._lock:
+                if key in self.cache:
+                    self._remove(key)
+            return
+
+        now = time.time()
+        expires_at = min(now + self.ttl, expires_at) if expires_at is not None else now + self.ttl
+        with self._lock:
+            if key in self.cache:
+                self._remove(key)
+
+            self.cache[key] = {'data': data, 'timestamp': now, 'expires_at': expires_at, 'size': size}
+            self._expiry[key] = expires_at
+            self.bytes += size
+
+            self._maybe_sweep(now)
+            while len(self.cache) > self.max_entries or self.bytes > self.max_bytes:
+                oldest_key = next(iter(self.cache))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            self._maybe_sweep(now)
+
+            item = self.cache.get(key)
+            if not item:
+                self.misses += 1
+                return None
+            if now >= item['expires_at']:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return item['data']
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self.cache:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.cache.clear()
+            self._expiry.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self.cache),
+                'bytes': self.bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def _remove(self, key: str) -> None:
+        item = self.cache.pop(key)
+        self._expiry.pop(key, None)
+        self.bytes -= item['size']
+
+    def _maybe_sweep(self, now: float) -> None:
+        if now - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = now
+
+        # _expiry is ordered by write time and most entries get the uniform TTL,
+        # so expired keys collect at the front and the sweep stops at the first
+        # live one. An entry capped to a shorter lifetime may wait for a later
+        # sweep, but get() already rejects it once it expires.
+        while self._expiry:
+            key, expires_at = next(iter(self._expiry.items()))
+            if now < expires_at:
+                break
+            self._remove(key)
+            self.expirations += 1
+
+    def _estimate_size(self, data: Any) -> int:
+        if isinstance(data, (str, bytes)):
+            return sys.getsizeof(data)
+        try:
+            return len(json.dumps(data, ensure_ascii=False, default=str).encode('utf-8'))
+        except (TypeError, ValueError):
+            return sys.getsizeof(data)
+
+
+class PersistentContentCache:
+
+    NAMESPACE_TTLS = {
+        "url_": 6 * 3600,
+        "html_": 6 * 3600,
+        "linkedin_": 3600,
+        "analysis_": 7 * 24 * 3600,
+        "doc_": 7 * 24 * 3600
+    }
+
+    def __init__(self,
+                 db_path: str,
+                 ttl: int = 3600,
+                 namespace_ttls: Optional[Dict[str, int]] = None,
+                 memory_cache: Optional[ContentCache] = None,
+                 sweep_interval: int = 300):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.namespace_ttls = dict(self.NAMESPACE_TTLS)
+        if namespace_ttls:
+            self.namespace_ttls.update(namespace_ttls)
+        self.sweep_interval = sweep_interval
+
+        # The in-process tier never outlives the shortest namespace TTL, and an
+        # entry loaded from disk keeps its disk expiry, so memory can not serve
+        # an entry the disk tier already considers expired.
+        self.memory = memory_cache or ContentCache(ttl=min([ttl, *self.namespace_ttls.values()]))
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.write_errors = 0
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires_at REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_expires_at ON entries(expires_at)")
 
     def set(self, key: str, data: Any) -> None:
-        self.cache[key] = {'data': data, 'timestamp': time.time()}
+        self.memory.set(key, data)
+        try:
+            value = zlib.compress(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+            now = time.time()
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, expires_at, size) VALUES (?, ?, ?, ?)",
+                    (key, value, now + self._ttl_for(key), len(value))
+                )
+            self._maybe_sweep(now)
+        except (TypeError, ValueError, sqlite3.Error):
+            with self._lock:
+                self.write_errors += 1
 
     def get(self, key: str) -> Optional[Any]:
-        item = self.cache.get(key)
-        if not item:
-            return None
-        if time.time() - item['timestamp'] > self.ttl:
-            del self.cache[key]
-            return None
-        return item['data']
+        data = self.memory.get(key)
+        if data is not None:
+            return data
+
+        try:
+            row = self._connect().execute(
+                "SELECT value, expires_at FROM entries WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        except sqlite3.Error:
+            row = None
+
+        data = None
+        if row is not None:
+            try:
+                data = json.loads(zlib.decompress(row[0]).decode('utf-8'))
+            except (zlib.error, ValueError):
+                # A corrupt row is a miss; drop it so the next set() rewrites it.
+                self._delete_row(key)
+                row = None
+
+        with self._lock:
+            if row is None:
+                self.disk_misses += 1
+                return None
+            self.disk_hits += 1
+
+        self.memory.set(key, data, expires_at=row[1])
+        return data
+
+    def delete(self, key: str) -> None:
+        self.memory.delete(key)
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self.memory.clear()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+    def stats(self) -> Dict[str, int]:
+        row = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        stats = {f"memory_{name}": value for name, value in self.memory.stats().items()}
+        stats.update({
+            'disk_entries': row[0],
+            'disk_bytes': row[1],
+            'disk_hits': self.disk_hits,
+            'disk_misses': self.disk_misses,
+            'write_errors': self.write_errors
+        })
+        return stats
+
+    def _delete_row(self, key: str) -> None:
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        except sqlite3.Error:
+            with self._lock:
+                self.write_errors += 1
+
+    def _ttl_for(self, key: str) -> int:
+        for prefix, ttl in self.namespace_ttls.items():
+            if key.startswith(prefix):
+                return ttl
+        return self.ttl
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _maybe_sweep(self, now: float) -> None:
+        with self._lock:
+            if now - self._last_sweep < self.sweep_interval:
+                return
+            self._last_sweep = now
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+
+
+def _create_cache():
+    db_path = os.getenv("CAREER_AGENT_CACHE_DB")
+    if db_path:
+        return PersistentContentCache(db_path)
+    return ContentCache()
 
 
-cache = ContentCache()
\ No newline at end of file
+cache = _create_cache()
@@ -0,0 +1,85 @@
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+from bs4 import CData, NavigableString, Tag
+
+from Tool.KeywordMatcher import KeywordMatcher
+
+
+TEXT_STRING_TYPES = frozenset([NavigableString, CData])
+
+# (char count, keyword bitmask, normalized head, normalized tail) of a block's get_text(" ", strip=True)
+BlockStats = Tuple[int, int, str, str]
+
+
+class ContentExtractor:
+    def __init__(self, matcher: KeywordMatcher, min_length: int = 200, separator: str = " "):
+        self.matcher = matcher
+        self.min_length = min_length
+        self.separator = separator
+        # A keyword spanning two text pieces fits in tail + separator + head of this width.
+        self._window = matcher.max_length
+
+    def best_block(self,
+                   root: Tag,
+                   score: Callable[[int, FrozenSet[str]], float],
+                   tag_name: str = "div") -> str:
+        stats = self.measure(root)
+        best_block = None
+        best_score = 0
+
+        for element in root.descendants:
+            if not isinstance(element, Tag) or element.name != tag_name:
+                continue
+            block = stats.get(id(element))
+            if block is None or block[0] <= self.min_length:
+                continue
+            block_score = score(block[0], self.matcher.keywords_in(block[1]))
+            if block_score > best_score:
+                best_score = block_score
+                best_block = element
+
+        if best_block is None:
+            return ""
+        return best_block.get_text(separator=self.separator, strip=True)
+
+    def measure(self, root: Tag) -> Dict[int, Optional[BlockStats]]:
+        tags = [element for element in root.descendants if isinstance(element, Tag)]
+        stats: Dict[int, Optional[BlockStats]] = {}
+
+        # Reverse document order visits every child before its parent, so each
+        # node is folded exactly once and no subtree text is rebuilt.
+        for tag in reversed(tags):
+            block = None
+            for child in tag.contents:
+                if isinstance(child, Tag):
+                    child_block = stats[id(child)]
+                elif type(child) in TEXT_STRING_TYPES:
+                    child_block = self._measure_string(child)
+                else:
+                    continue
+                block = self._join(block, child_block)
+            stats[id(tag)] = block
+
+        return stats
+
+    def _measure_string(self, string: NavigableString) -> Optional[BlockStats]:
+        text = string.strip()
+        if not text:
+            return None
+        normalized = self.matcher.normalize(text)
+        return len(text), self.matcher.mask(normalized), normalized[:self._window], normalized[-self._window:]
+
+    def _join(self, left: Optional[BlockStats], right: Optional[BlockStats]) -> Optional[BlockStats]:
+        if left is None:
+            return right
+        if right is None:
+            return left
+
+        left_chars, left_mask, left_head, left_tail = left
+        right_chars, right_mask, right_head, right_tail = right
+        window = self._window
+        separator = self.separator
+
+        mask = left_mask | right_mask | self.matcher.mask(left_tail + separator + right_head)
+        head = left_head if len(left_head) >= window else (left_head + separator + right_head)[:window]
+        tail = right_tail if len(right_tail) >= window else (left_tail + separator + right_tail)[-window:]
+        return left_chars + len(separator) + right_chars, mask, head, tail
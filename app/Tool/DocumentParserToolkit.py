@@ -1,8 +1,8 @@
 from agno.tools import Toolkit
-import PyPDF2
 import os
 import json
 from Tool.ContentCache import cache
+from Tool.DocumentTextExtractor import DocumentExtractionError, document_extractor
 from agno.utils.log import logger
 
 
@@ -45,34 +45,12 @@ class DocumentParserToolkit(Toolkit):
             
     def extract_from_pdf(self, file_path: str) -> str:
         try:
-            if not os.path.exists(file_path):
-                return json.dumps({"error": f"PDF dosyası bulunamadı: {file_path}"})
-            
-            text = ""
-            with open(file_path, "rb") as file:
-                try:
-                    reader = PyPDF2.PdfReader(file)
-                    for page_num in range(len(reader.pages)):
-                        try:
-                            page_text = reader.pages[page_num].extract_text()
-                            if page_text.strip():
-                                text += page_text + "\n"
-                        except Exception as e:
-                            logger.warning(f"Sayfa {page_num + 1} okunamadı: {str(e)}")
-                            continue
-                except Exception as e:
-                    logger.error(f"PDF reader hatası: {str(e)}")
-                    return json.dumps({"error": f"PDF okuma hatası: {str(e)}"})
-            
-            if not text.strip():
-                return json.dumps({"error": "PDF'den metin çıkarılamadı. Dosya görüntü tabanlı olabilir."})
-                
-            return text.strip()
-            
-        except ImportError:
-            error_msg = "PyPDF2 kütüphanesi yüklü değil. 'pip install PyPDF2' komutu ile yükleyebilirsiniz."
-            logger.error(error_msg)
-            return json.dumps({"error": error_msg})
+            return document_extractor.extract_pdf(file_path).strip()
+        except FileNotFoundError:
+            return json.dumps({"error": f"PDF dosyası bulunamadı: {file_path}"})
+        except DocumentExtractionError as e:
+            logger.error(str(e))
+            return json.dumps({"error": str(e)})
         except Exception as e:
             logger.error(f"PDF okuma hatası: {str(e)}")
             return json.dumps({"error": f"PDF okuma hatası: {str(e)}"})
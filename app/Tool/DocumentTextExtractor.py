@@ -0,0 +1,160 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import multiprocessing
+import os
+import threading
+
+from agno.utils.log import logger
+from Tool.ContentCache import cache
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+
+class DocumentExtractionError(Exception):
+    pass
+
+
+def _open_pdf(file):
+    if PyPDF2 is None:
+        raise DocumentExtractionError("PyPDF2 kütüphanesi yüklü değil. 'pip install PyPDF2' komutu ile yükleyebilirsiniz.")
+    try:
+        return PyPDF2.PdfReader(file)
+    except Exception as e:
+        raise DocumentExtractionError(f"PDF okuma hatası: {str(e)}") from e
+
+
+def _extract_pages(reader, start: int, stop: int) -> Iterator[Tuple[int, str, Optional[str]]]:
+    for page_num in range(start, stop):
+        try:
+            yield page_num, reader.pages[page_num].extract_text() or "", None
+        except Exception as e:
+            yield page_num, "", str(e)
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[Tuple[int, str, Optional[str]]]:
+    # Runs in a worker process; page errors are returned so the parent logs them.
+    with open(path, "rb") as file:
+        return list(_extract_pages(_open_pdf(file), start, stop))
+
+
+class DocumentTextExtractor:
+    def __init__(self, content_cache=cache, max_workers: Optional[int] = None, parallel_min_pages: int = 16):
+        self.cache = content_cache
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_min_pages = parallel_min_pages
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def extract_pdf(self, file_path: str, parallel: Optional[bool] = None) -> str:
+        return "".join(self.stream_pdf(file_path, parallel=parallel))
+
+    def stream_pdf(self, file_path: str, parallel: Optional[bool] = None) -> Iterator[str]:
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"PDF dosyası bulunamadı: {file_path}")
+
+        cache_key = f"doc_text_{self.content_digest(path)}"
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"PDF metni önbellekten döndürülüyor: {path}")
+            yield cached
+            return
+
+        pages = []
+        for page_text in self.iter_pdf_pages(path, parallel=parallel):
+            yield page_text if not pages else "\n" + page_text
+            pages.append(page_text)
+
+        text = "\n".join(pages)
+        if not text.strip():
+            raise DocumentExtractionError("PDF'den metin çıkarılamadı. Dosya görüntü tabanlı olabilir.")
+
+        self.cache.set(cache_key, text)
+        logger.info(f"✅ PDF başarıyla okundu: {len(text)} karakter")
+
+    def iter_pdf_pages(self, path: Path, parallel: Optional[bool] = None) -> Iterator[str]:
+        with open(path, "rb") as file:
+            page_count = len(_open_pdf(file).pages)
+
+        if parallel is None:
+            parallel = self.max_workers > 1 and page_count >= self.parallel_min_pages
+
+        next_page = 0
+        if parallel:
+            try:
+                for page_num, page_text, error in self._iter_parallel(path, page_count):
+                    next_page = page_num + 1
+                    if self._accept_page(page_num, page_text, error):
+                        yield page_text
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Paralel PDF okuma başarısız, sıralı okumaya geçiliyor: {str(e)}")
+                with self._lock:
+                    self._pool = None
+
+        # Sequential mode, or whatever a failed pool left unread.
+        if next_page < page_count:
+            with open(path, "rb") as file:
+                reader = _open_pdf(file)
+                for page_num, page_text, error in _extract_pages(reader, next_page, page_count):
+                    if self._accept_page(page_num, page_text, error):
+                        yield page_text
+
+    def _iter_parallel(self, path: Path, page_count: int) -> Iterator[Tuple[int, str, Optional[str]]]:
+        # Every chunk re-opens the PDF in its worker, so chunks stay few; two per
+        # worker still lets the first pages arrive early. Results are yielded
+        # strictly in page order.
+        chunk_size = max(1, -(-page_count // (self.max_workers * 2)))
+        pool = self._get_pool()
+        futures: List[Future] = [
+            pool.submit(_extract_page_range, str(path), start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _accept_page(self, page_num: int, page_text: str, error: Optional[str]) -> bool:
+        if error:
+            logger.warning(f"Sayfa {page_num + 1} okunamadı: {error}")
+            return False
+        return bool(page_text.strip())
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: forking the threaded Streamlit/agent process can deadlock workers.
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+            return self._pool
+
+    def content_digest(self, path: Path) -> str:
+        # The mtime/size fingerprint only saves re-hashing an unchanged file;
+        # the cache itself is keyed by content, so a copied or re-uploaded CV
+        # still hits.
+        stat = path.stat()
+        fingerprint = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(fingerprint)
+        if digest:
+            return digest
+
+        hasher = sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        with self._lock:
+            self._digests[fingerprint] = digest
+        return digest
+
+
+document_extractor = DocumentTextExtractor()
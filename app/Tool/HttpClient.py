@@ -0,0 +1,100 @@
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from agno.utils.log import logger
+
+
+class ResponseTooLargeError(requests.exceptions.RequestException):
+    pass
+
+
+class HttpClient:
+    def __init__(self,
+                 pool_connections: int = 4,
+                 pool_maxsize: int = 16,
+                 max_retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 max_response_bytes: int = 5 * 1024 * 1024,
+                 chunk_size: int = 64 * 1024):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_response_bytes = max_response_bytes
+        self.chunk_size = chunk_size
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, headers: Optional[dict] = None, timeout: float = 15, **kwargs) -> requests.Response:
+        session = self.session_for(url)
+        response = session.get(url, headers=headers, timeout=timeout, stream=True, **kwargs)
+        try:
+            self._read_limited(response)
+        finally:
+            response.close()
+        return response
+
+    def session_for(self, url: str) -> requests.Session:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._create_session()
+                self._sessions[host] = session
+                logger.debug(f"🔌 Yeni HTTP oturumu açıldı: {host}")
+            return session
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def _create_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _read_limited(self, response: requests.Response) -> None:
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_response_bytes:
+            raise ResponseTooLargeError(
+                f"Yanıt boyutu sınırı aşıldı ({content_length} > {self.max_response_bytes} bayt): {response.url}",
+                response=response
+            )
+
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(chunk_size=self.chunk_size):
+            total += len(chunk)
+            if total > self.max_response_bytes:
+                raise ResponseTooLargeError(
+                    f"Yanıt boyutu sınırı aşıldı (>{self.max_response_bytes} bayt): {response.url}",
+                    response=response
+                )
+            chunks.append(chunk)
+
+        # Hand the body back to requests so .text/.json() keep working as usual.
+        response._content = b"".join(chunks)
+        response._content_consumed = True
+
+
+http_client = HttpClient()
@@ -1,12 +1,16 @@
 from typing import List
 import json
 from agno.tools import Toolkit
-from Tool.ContentCache import cache
+from Tool.LLMResponseCache import llm_cache
 from agno.utils.log import logger
 
 class JobAnalysisToolkit(Toolkit):    
-    def __init__(self):
+    ANALYSIS_PROMPT_VERSION = "1"
+    CACHE_TASK = "job_description"
+
+    def __init__(self, model_id: str = "gpt-4o"):
         super().__init__(name="job_analysis")
+        self.model_id = model_id
         self.register(self.analyze_job_description)
         self.register(self.extract_job_details)
         self.register(self.compare_jobs)
@@ -16,16 +20,22 @@ class JobAnalysisToolkit(Toolkit):
             if not content or content.startswith('{"error"'):
                 return json.dumps({"error": "Geçerli içerik bulunamadı."})
                 
-            cache_key = f"analysis_{hash(content)}"
-            cached = cache.get(cache_key)
+            cache_key = self.cache_key(content)
+            cached = llm_cache.get_by_key(cache_key)
             if cached:
+                logger.info("♻️ İş ilanı analizi önbellekten döndürüldü")
                 return cached
             
+            # The toolkit is shared by every conversation of a pooled agent, so
+            # the key travels with the prompt and comes back with the result
+            # instead of being kept on the instance.
             prepared_content = {
                 "content": content,
+                "cache_key": cache_key,
                 "instruction": "Bu iş ilanı içeriğini analiz et ve aşağıdaki yapılandırılmış bilgileri çıkar: "
                 "pozisyon, şirket, konum, iş tipi (tam zamanlı, yarı zamanlı vb.), deneyim seviyesi, "
-                "gereken beceriler (teknik ve kişisel), sorumluluklar, avantajlar/faydalar, ve gereken eğitim düzeyi"
+                "gereken beceriler (teknik ve kişisel), sorumluluklar, avantajlar/faydalar, ve gereken eğitim düzeyi. "
+                "Sonucu extract_job_details() ile yapılandırırken cache_key değerini aynen geri ver."
             }
             
             return json.dumps(prepared_content, ensure_ascii=False)
@@ -34,14 +44,19 @@ class JobAnalysisToolkit(Toolkit):
             logger.error(f"İş ilanı analizi hatası: {str(e)}")
             return json.dumps({"error": f"İş ilanı analizi hatası: {str(e)}"})
     
-    def extract_job_details(self, analysis_result: str) -> str:
+    def extract_job_details(self, analysis_result: str, cache_key: str = "") -> str:
         try:
+            if llm_cache.is_key(cache_key, self.CACHE_TASK) and analysis_result and not analysis_result.startswith('{"error"'):
+                llm_cache.set_by_key(cache_key, analysis_result)
             return analysis_result
             
         except Exception as e:
             logger.error(f"İş detayları çıkartma hatası: {str(e)}")
             return json.dumps({"error": f"İş detayları çıkartma hatası: {str(e)}"})
     
+    def cache_key(self, content: str) -> str:
+        return llm_cache.key(self.CACHE_TASK, content, self.model_id, self.ANALYSIS_PROMPT_VERSION)
+
     def compare_jobs(self, job_analyses: List[str]) -> str:
         try:
             if not job_analyses or len(job_analyses) < 2:
@@ -8,6 +8,10 @@ import random
 import os
 import sys
 
+from Tool.CompatibilityPreScorer import extract_jobs, pre_scorer
+from Tool.JobResumeMatcher import JobResumeMatcher
+from Tool.PromptBudget import PromptSection, prompt_budget
+
 
 class JobCompatibilityToolkit(Toolkit):
     
@@ -25,6 +29,8 @@ class JobCompatibilityToolkit(Toolkit):
         self.register(self.analyze_compatibility)
         self.register(self.save_compatibility_report)
         self.register(self.analyze_single_job_compatibility)
+        self.register(self.shortlist_jobs)
+        self.register(self.rank_job_resume_matches)
     
     def _safe_encode_decode(self, text: str) -> str:
         if not isinstance(text, str):
@@ -87,7 +93,50 @@ class JobCompatibilityToolkit(Toolkit):
         search_dirs = [self.resume_analysis_dir]
         return self._load_analysis_file(resume_analysis_file, search_dirs, "Resume analysis")
     
-    def analyze_compatibility(self, job_data: str, resume_data: str) -> str:
+    def shortlist_jobs(self, job_analysis_data: str, resume_data: str, top_k: int = 5) -> str:
+        try:
+            job_data = self._parse_json_safely(job_analysis_data, "job_analysis")
+            if isinstance(job_data, str):
+                return job_data
+
+            resume_parsed = self._parse_json_safely(resume_data, "resume")
+            if isinstance(resume_parsed, str):
+                return resume_parsed
+
+            ranking = pre_scorer.rank(job_data, resume_parsed)
+            logger.info(f"{len(ranking)} iş ilanı yerel olarak puanlandı, ilk {min(top_k, len(ranking))} ilan LLM analizine seçildi")
+            return self._safe_json_dumps({
+                "total_jobs": len(ranking),
+                "top_k": top_k,
+                "shortlist": ranking[:max(0, top_k)],
+                "filtered_out": [
+                    {"job_index": entry["job_index"], "job_title": entry["job_title"], "overall_score": entry["overall_score"]}
+                    for entry in ranking[max(0, top_k):]
+                ]
+            })
+
+        except Exception as e:
+            error_msg = f"Job shortlist error: {str(e)}"
+            logger.error(error_msg)
+            return self._safe_json_dumps({"error": error_msg})
+
+    def rank_job_resume_matches(self, top_n: int = 5) -> str:
+        try:
+            matcher = JobResumeMatcher.from_directories(str(self.job_analysis_dir), str(self.resume_analysis_dir))
+            logger.info(f"Benzerlik matrisi hesaplandı: {len(matcher.job_ids)} iş x {len(matcher.resume_ids)} CV")
+            return self._safe_json_dumps({
+                "job_count": len(matcher.job_ids),
+                "resume_count": len(matcher.resume_ids),
+                "top_jobs_per_resume": matcher.top_jobs_per_resume(top_n),
+                "top_resumes_per_job": matcher.top_resumes_per_job(top_n)
+            })
+
+        except Exception as e:
+            error_msg = f"Job-resume matching error: {str(e)}"
+            logger.error(error_msg)
+            return self._safe_json_dumps({"error": error_msg})
+
+    def analyze_compatibility(self, job_data: str, resume_data: str, top_k: int = 5) -> str:
         try:
             job_info = self._parse_json_safely(job_data, "job data")
             if isinstance(job_info, str) and job_info.startswith('{"error"'):
@@ -96,17 +145,37 @@ class JobCompatibilityToolkit(Toolkit):
             resume_info = self._parse_json_safely(resume_data, "resume data")
             if isinstance(resume_info, str) and resume_info.startswith('{"error"'):
                 return resume_info
-            
+
+            jobs = extract_jobs(job_info)
+            ranking = pre_scorer.rank(job_info, resume_info)
+            pre_screening_note = "All available postings are included."
+            shortlist = ranking
+            if len(jobs) > top_k > 0:
+                shortlist = ranking[:top_k]
+                job_info = {"results": [{"job_title": jobs[entry["job_index"]][0], **jobs[entry["job_index"]][1]} for entry in shortlist]}
+                pre_screening_note = (
+                    f"{len(jobs)} postings were pre-scored locally; only the top {top_k} are included below. "
+                    f"Local pre-scores (out of 10): {self._safe_json_dumps({entry['job_title']: entry['overall_score'] for entry in shortlist})}"
+                )
+                logger.info(f"Yerel ön puanlama: {len(jobs)} ilandan {top_k} tanesi LLM analizine gönderiliyor")
+
+            jobs_json, resume_json = prompt_budget.fit([
+                PromptSection(job_info),
+                PromptSection(resume_info, optional_fields=["personal_info"])
+            ])
+
             detailed_analysis_prompt = f"""
-            You are a Job Compatibility Analysis Expert. Perform comprehensive candidate evaluation for ALL available job postings.
+            You are a Job Compatibility Analysis Expert. Perform comprehensive candidate evaluation for the job postings provided below.
+
+            PRE-SCREENING: {pre_screening_note}
 
-            ALL JOB POSTINGS DATA:
-            {self._safe_json_dumps(job_info, indent=2)}
+            JOB POSTINGS DATA (see PRE-SCREENING for how they were selected):
+            {jobs_json}
 
             CANDIDATE CV ANALYSIS:
-            {self._safe_json_dumps(resume_info, indent=2)}
+            {resume_json}
 
-            TASK: Analyze candidate compatibility across ALL available job postings and provide:
+            TASK: Analyze candidate compatibility across the job postings provided and provide:
             1. Overall compatibility assessment for the candidate across all positions
             2. Average compatibility scores across all jobs
             3. Best matching jobs identification
@@ -189,21 +258,23 @@ class JobCompatibilityToolkit(Toolkit):
             CRITICAL: Return ONLY the JSON response, no additional text or explanations.
             """
 
+            # The job and CV data are only sent inside the budgeted prompt; a raw
+            # copy next to it would put the untrimmed JSON in front of the model again.
             compatibility_analysis = {
-                "job_requirements": job_info,
-                "candidate_profile": resume_info,
                 "analysis_instruction": detailed_analysis_prompt.strip(),
                 "analysis_type": "multi_job_detailed_compatibility",
+                "pre_screening": {"shortlist": shortlist, "filtered_out_count": len(ranking) - len(shortlist)},
                 "metadata": {
                     "analysis_level": "detailed_multiagent_quality",
-                    "job_count": len(job_info) if isinstance(job_info, dict) else 1,
+                    "job_count": len(jobs),
+                    "analyzed_job_count": len(shortlist),
                     "scoring_categories": 6,
                     "output_format": "structured_json_with_market_analysis"
                 }
             }
             
             logger.info("Detailed multi-job compatibility analysis data prepared")
-            return self._safe_json_dumps(compatibility_analysis, indent=2)
+            return self._safe_json_dumps(compatibility_analysis, separators=(",", ":"))
             
         except Exception as e:
             error_msg = f"Compatibility analysis error: {str(e)}"
@@ -367,6 +438,11 @@ class JobCompatibilityToolkit(Toolkit):
             if not selected_job:
                 return self._safe_json_dumps({"error": "Specified job not found"})
             
+            job_json, resume_json = prompt_budget.fit([
+                PromptSection(selected_job, optional_fields=["note", "job_url", "company_website", "headquarters", "company_description", "benefits"]),
+                PromptSection(resume_parsed, optional_fields=["personal_info"])
+            ])
+
             detailed_analysis_prompt = f"""
             You are a Job Compatibility Analysis Expert. Perform a comprehensive candidate evaluation for this specific position.
 
@@ -374,10 +450,10 @@ class JobCompatibilityToolkit(Toolkit):
             COMPANY: {company_name}
 
             JOB ANALYSIS DATA:
-            {self._safe_json_dumps(selected_job, indent=2)}
+            {job_json}
 
             CANDIDATE CV ANALYSIS:
-            {self._safe_json_dumps(resume_parsed, indent=2)}
+            {resume_json}
 
             DETAILED SCORING CRITERIA (out of 10):
 
@@ -460,10 +536,9 @@ class JobCompatibilityToolkit(Toolkit):
                 "job_title": f"{company_name} - {position_name}",
                 "company_name": company_name,
                 "position_name": position_name,
-                "selected_job_data": selected_job,
-                "resume_data": resume_parsed,
                 "analysis_instruction": detailed_analysis_prompt.strip(),
                 "analysis_type": "single_job_detailed_compatibility",
+                "local_pre_score": pre_scorer.score(selected_job, resume_parsed) if isinstance(selected_job, dict) else None,
                 "metadata": {
                     "job_index": job_index,
                     "analysis_level": "detailed_multiagent_quality",
@@ -473,7 +548,7 @@ class JobCompatibilityToolkit(Toolkit):
             }
             
             logger.info(f"Detailed single job compatibility analysis prepared: {company_name} - {position_name}")
-            return self._safe_json_dumps(single_compatibility)
+            return self._safe_json_dumps(single_compatibility, separators=(",", ":"))
             
         except Exception as e:
             error_msg = f"Single job compatibility analysis error: {str(e)}"
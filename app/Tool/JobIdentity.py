@@ -0,0 +1,71 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+import json
+import re
+from agno.utils.log import logger
+
+
+LINKEDIN_JOB_ID_PATTERN = re.compile(r"(?:currentJobId=|/jobs/view/(?:[^/?#]*-)?)(\d+)")
+
+TRACKING_PARAMS = frozenset([
+    "refid", "trackingid", "trk", "position", "pagenum", "originalsubdomain",
+    "ebp", "lipi", "midtoken", "midsig", "fbclid", "gclid"
+])
+
+
+def extract_job_id(job_url: str) -> Optional[str]:
+    match = LINKEDIN_JOB_ID_PATTERN.search(job_url or "")
+    return match.group(1) if match else None
+
+
+def normalize_job_url(job_url: str) -> str:
+    if not job_url:
+        return ""
+
+    job_id = extract_job_id(job_url)
+    parsed = urlparse(job_url.strip())
+    if job_id and "linkedin.com" in parsed.netloc.lower():
+        return f"https://www.linkedin.com/jobs/view/{job_id}/"
+
+    query = [
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, "", urlencode(query), ""))
+
+
+def job_key(job: Dict[str, str]) -> str:
+    job_url = job.get("jobUrl", "")
+    job_id = job.get("jobId") or extract_job_id(job_url)
+    if job_id:
+        return f"id:{job_id}"
+    if job_url:
+        return f"url:{normalize_job_url(job_url)}"
+    return "card:" + "|".join(job.get(field, "").strip().lower() for field in ("position", "company", "location"))
+
+
+def dedupe_jobs(jobs: Iterable[Dict[str, str]], seen_keys: Optional[Set[str]] = None) -> List[Dict[str, str]]:
+    seen_keys = set() if seen_keys is None else seen_keys
+    unique_jobs = []
+    for job in jobs:
+        key = job_key(job)
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        unique_jobs.append(job)
+    return unique_jobs
+
+
+def load_result_jobs(file_path: Path) -> List[Dict[str, str]]:
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"⚠️ Sonuç dosyası okunamadı: {file_path} ({e})")
+        return []
+
+    jobs = data.get("results", []) if isinstance(data, dict) else data
+    return [job for job in jobs if isinstance(job, dict)] if isinstance(jobs, list) else []
+
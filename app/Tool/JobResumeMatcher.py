@@ -0,0 +1,183 @@
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+import json
+import re
+
+import numpy as np
+
+from Tool.CompatibilityPreScorer import JOB_SKILL_FIELDS, as_list, extract_jobs, flatten_text, normalize_text
+
+
+RESUME_SKILL_FIELDS = ("technical", "technical_skills", "tools", "frameworks", "programming_languages")
+SKILL_WEIGHT = 2
+WORD_PATTERN = re.compile(r"[\w+#]+(?:[.\-][\w+#]+)*")
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(WORD_PATTERN.findall(normalize_text(skill)))
+
+
+def job_skills(job: dict) -> List[str]:
+    skills = []
+    for field in JOB_SKILL_FIELDS:
+        skills.extend(as_list(job.get(field)))
+    return skills
+
+
+def resume_skills(resume: dict) -> List[str]:
+    skills = []
+    section = resume.get("skills")
+    if isinstance(section, dict):
+        for field in RESUME_SKILL_FIELDS:
+            skills.extend(as_list(section.get(field)))
+    else:
+        skills.extend(as_list(section))
+    skills.extend(as_list(resume.get("technical_skills")))
+    for project in resume.get("projects", []) or []:
+        if isinstance(project, dict):
+            skills.extend(as_list(project.get("technologies")))
+    return skills
+
+
+def is_fallback(analysis: Any) -> bool:
+    # Template analyses saved when the LLM step failed hold placeholder text,
+    # not a real posting or CV.
+    return isinstance(analysis, dict) and bool(analysis.get("fallback"))
+
+
+class JobResumeMatcher:
+    def __init__(self, max_ngram: int = 3):
+        self.max_ngram = max_ngram
+        self.job_ids: List[str] = []
+        self.resume_ids: List[str] = []
+        self.vocabulary: Dict[str, int] = {}
+        self.similarity = np.zeros((0, 0), dtype=np.float32)
+
+    def fit(self, jobs: Dict[str, dict], resumes: Dict[str, dict]) -> "JobResumeMatcher":
+        self.job_ids = list(jobs)
+        self.resume_ids = list(resumes)
+        job_skill_lists = [job_skills(job) for job in jobs.values()]
+        resume_skill_lists = [resume_skills(resume) for resume in resumes.values()]
+
+        terms = {normalize_skill(skill) for skills in job_skill_lists + resume_skill_lists for skill in skills}
+        terms.discard("")
+        self.vocabulary = {term: index for index, term in enumerate(sorted(terms))}
+
+        documents = list(zip(job_skill_lists, jobs.values())) + list(zip(resume_skill_lists, resumes.values()))
+        vectors = self._tfidf([self._term_counts(skills, data) for skills, data in documents])
+        self.similarity = self._similarity(vectors[:len(self.job_ids)], vectors[len(self.job_ids):])
+        return self
+
+    @classmethod
+    def from_directories(cls, job_dir: str = "Jobs/Job_Analysis", resume_dir: str = "Jobs/Resume_Analysis", **kwargs) -> "JobResumeMatcher":
+        jobs: Dict[str, dict] = {}
+        for path, data in cls._load_json_files(Path(job_dir)):
+            entries = extract_jobs(data)
+            for index, (_, job) in enumerate(entries):
+                if not is_fallback(job):
+                    jobs[path.name if len(entries) == 1 else f"{path.name}#{index}"] = job
+
+        resumes = {
+            path.name: data for path, data in cls._load_json_files(Path(resume_dir))
+            if isinstance(data, dict) and not is_fallback(data)
+        }
+        return cls(**kwargs).fit(jobs, resumes)
+
+    def top_jobs_for_resume(self, resume_id: str, n: int = 5) -> List[Tuple[str, float]]:
+        column = self.similarity[:, self.resume_ids.index(resume_id)]
+        return [(self.job_ids[index], score) for index, score in self._top_n(column[None, :], n)[0]]
+
+    def top_resumes_for_job(self, job_id: str, n: int = 5) -> List[Tuple[str, float]]:
+        row = self.similarity[self.job_ids.index(job_id)]
+        return [(self.resume_ids[index], score) for index, score in self._top_n(row[None, :], n)[0]]
+
+    def top_jobs_per_resume(self, n: int = 5) -> Dict[str, List[Tuple[str, float]]]:
+        ranked = self._top_n(self.similarity.T, n)
+        return {resume_id: [(self.job_ids[index], score) for index, score in ranked[row]] for row, resume_id in enumerate(self.resume_ids)}
+
+    def top_resumes_per_job(self, n: int = 5) -> Dict[str, List[Tuple[str, float]]]:
+        ranked = self._top_n(self.similarity, n)
+        return {job_id: [(self.resume_ids[index], score) for index, score in ranked[row]] for row, job_id in enumerate(self.job_ids)}
+
+    def _term_counts(self, skills: Iterable[str], data: Any) -> Counter:
+        counts: Counter = Counter()
+        for skill in skills:
+            term = normalize_skill(skill)
+            if term in self.vocabulary:
+                counts[term] += SKILL_WEIGHT
+
+        # Free text (requirements, responsibilities, experience) only
+        # contributes terms that are a listed skill somewhere in the corpus.
+        words = WORD_PATTERN.findall(normalize_text(flatten_text(data)))
+        for size in range(1, self.max_ngram + 1):
+            for start in range(len(words) - size + 1):
+                term = " ".join(words[start:start + size])
+                if term in self.vocabulary:
+                    counts[term] += 1
+        return counts
+
+    def _tfidf(self, documents: List[Counter]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        # Each document is a sparse row of (term indices, weights), so memory
+        # follows the number of terms a document uses, not the vocabulary size.
+        rows = []
+        document_frequency = np.zeros(len(self.vocabulary), dtype=np.int64)
+        for counts in documents:
+            indices = np.fromiter((self.vocabulary[term] for term in counts), dtype=np.int64, count=len(counts))
+            values = 1 + np.log(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+            document_frequency[indices] += 1
+            rows.append((indices, values))
+
+        idf = (np.log((1 + len(documents)) / (1 + document_frequency)) + 1).astype(np.float32)
+        vectors = []
+        for indices, values in rows:
+            values = values * idf[indices]
+            norm = np.linalg.norm(values)
+            vectors.append((indices, values / norm if norm > 0 else values))
+        return vectors
+
+    def _similarity(self, job_vectors: List[Tuple[np.ndarray, np.ndarray]], resume_vectors: List[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+        similarity = np.zeros((len(job_vectors), len(resume_vectors)), dtype=np.float32)
+        if not job_vectors or not resume_vectors:
+            return similarity
+
+        # Inverted index over the CV vectors: a job row only touches the CVs
+        # that share one of its terms.
+        terms = np.concatenate([indices for indices, _ in resume_vectors])
+        columns = np.concatenate([np.full(len(indices), column) for column, (indices, _) in enumerate(resume_vectors)])
+        weights = np.concatenate([values for _, values in resume_vectors])
+        order = np.argsort(terms, kind="stable")
+        terms, columns, weights = terms[order], columns[order], weights[order]
+
+        for row, (indices, values) in enumerate(job_vectors):
+            starts = np.searchsorted(terms, indices, side="left")
+            ends = np.searchsorted(terms, indices, side="right")
+            for start, end, value in zip(starts.tolist(), ends.tolist(), values.tolist()):
+                if start < end:
+                    similarity[row, columns[start:end]] += value * weights[start:end]
+        return similarity
+
+    def _top_n(self, scores: np.ndarray, n: int) -> List[List[Tuple[int, float]]]:
+        n = min(n, scores.shape[1])
+        if n <= 0:
+            return [[] for _ in range(scores.shape[0])]
+        candidates = np.argpartition(-scores, n - 1, axis=1)[:, :n]
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        top_indices = np.take_along_axis(candidates, order, axis=1)
+        top_scores = np.take_along_axis(candidate_scores, order, axis=1)
+        return [
+            [(int(index), round(float(score), 4)) for index, score in zip(index_row, score_row)]
+            for index_row, score_row in zip(top_indices, top_scores)
+        ]
+
+    @staticmethod
+    def _load_json_files(directory: Path) -> List[Tuple[Path, Any]]:
+        files = []
+        for path in sorted(directory.glob("*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    files.append((path, json.load(f)))
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ Analiz dosyası okunamadı: {path} ({e})")
+        return files
@@ -0,0 +1,102 @@
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, Iterator, List
+import re
+
+
+TURKISH_I_FOLD = str.maketrans({"İ": "i", "ı": "i"})
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str], fold_turkish: bool = False, scan_threshold: int = 96):
+        self.fold_turkish = fold_turkish
+        self.scan_threshold = scan_threshold
+
+        originals: Dict[str, List[str]] = defaultdict(list)
+        for keyword in keywords:
+            normalized = self.normalize(keyword)
+            if normalized and keyword not in originals[normalized]:
+                originals[normalized].append(keyword)
+
+        self.keywords = sorted(originals)
+        self.max_length = max([len(keyword) for keyword in self.keywords] + [1])
+        self._originals = [tuple(originals[keyword]) for keyword in self.keywords]
+        self._bits = {keyword: 1 << index for index, keyword in enumerate(self.keywords)}
+        # The trie regex only reports the longest keyword starting at each
+        # position, so shorter keywords sharing that start are added back here.
+        self._prefix_masks = {
+            keyword: sum(self._bits[other] for other in self.keywords if keyword.startswith(other))
+            for keyword in self.keywords
+        }
+        self._pattern = re.compile(self._trie_pattern(self.keywords)) if self.keywords else None
+
+    def normalize(self, text: str) -> str:
+        if self.fold_turkish and ("İ" in text or "ı" in text):
+            text = text.translate(TURKISH_I_FOLD)
+        return text.lower()
+
+    def find(self, text: str, normalized: bool = False) -> FrozenSet[str]:
+        return self.keywords_in(self.mask(text if normalized else self.normalize(text)))
+
+    def count(self, text: str, normalized: bool = False) -> Dict[str, int]:
+        counts: Dict[str, int] = defaultdict(int)
+        if self._pattern is None:
+            return counts
+        text = text if normalized else self.normalize(text)
+        for matched in self._matches(text):
+            for keyword in self._expand(self._prefix_masks[matched]):
+                counts[keyword] += 1
+        return dict(counts)
+
+    def mask(self, normalized_text: str) -> int:
+        if self._pattern is None:
+            return 0
+        # CPython's substring search outruns sre once a text is longer than
+        # about a hundred characters (whole pages, full job descriptions), so
+        # those fall back to one `in` per keyword. The compiled pattern wins on
+        # the short text nodes and seams ContentExtractor feeds in.
+        if len(normalized_text) > self.scan_threshold:
+            return sum(bit for keyword, bit in self._bits.items() if keyword in normalized_text)
+
+        mask = 0
+        prefix_masks = self._prefix_masks
+        for matched in self._matches(normalized_text):
+            mask |= prefix_masks[matched]
+        return mask
+
+    def _matches(self, normalized_text: str) -> Iterator[str]:
+        # Restarting one character after each hit keeps overlapping keywords
+        # (substring semantics) in a single scan. A plain pattern rather than a
+        # lookahead lets sre skip to candidate first characters in C.
+        search = self._pattern.search
+        match = search(normalized_text)
+        while match is not None:
+            yield match.group()
+            match = search(normalized_text, match.start() + 1)
+
+    def keywords_in(self, mask: int) -> FrozenSet[str]:
+        return frozenset(self._expand(mask))
+
+    def _expand(self, mask: int) -> List[str]:
+        keywords = []
+        while mask:
+            lowest = mask & -mask
+            keywords.extend(self._originals[lowest.bit_length() - 1])
+            mask ^= lowest
+        return keywords
+
+    def _trie_pattern(self, keywords: List[str]) -> str:
+        trie: dict = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        def build(node: dict) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            return f"(?:{body})?" if "" in node else body
+
+        return build(trie)
@@ -0,0 +1,63 @@
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Dict, Optional
+import os
+import threading
+import dotenv
+
+from Tool.ContentCache import PersistentContentCache
+
+dotenv.load_dotenv()
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def content_hash(*parts: str) -> str:
+    digest = sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class LLMResponseCache:
+    def __init__(self, db_path: str = "Jobs/.cache/llm_responses.sqlite3", ttl: int = 30 * 24 * 3600):
+        path = Path(db_path)
+        self.db_path = path if path.is_absolute() else PROJECT_ROOT / path
+        self.ttl = ttl
+        self._store: Optional[PersistentContentCache] = None
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> PersistentContentCache:
+        # Opened on first use so importing the agents does not create the
+        # database directory before any analysis runs.
+        with self._lock:
+            if self._store is None:
+                self._store = PersistentContentCache(str(self.db_path), ttl=self.ttl, namespace_ttls={"llm_": self.ttl})
+            return self._store
+
+    def key(self, task: str, content: str, model: str, prompt_version: str) -> str:
+        return f"llm_{task}_{content_hash(model, prompt_version, content)}"
+
+    def is_key(self, key: str, task: str) -> bool:
+        digest = key[len(f"llm_{task}_"):]
+        return key.startswith(f"llm_{task}_") and len(digest) == 64 and all(char in "0123456789abcdef" for char in digest)
+
+    def get(self, task: str, content: str, model: str, prompt_version: str) -> Optional[Any]:
+        return self.get_by_key(self.key(task, content, model, prompt_version))
+
+    def set(self, task: str, content: str, model: str, prompt_version: str, response: Any) -> None:
+        self.set_by_key(self.key(task, content, model, prompt_version), response)
+
+    def get_by_key(self, key: str) -> Optional[Any]:
+        return self.store.get(key)
+
+    def set_by_key(self, key: str, response: Any) -> None:
+        self.store.set(key, response)
+
+    def stats(self) -> Dict[str, int]:
+        return self.store.stats()
+
+
+llm_cache = LLMResponseCache(os.getenv("CAREER_AGENT_LLM_CACHE_DB", "Jobs/.cache/llm_responses.sqlite3"))
@@ -1,22 +1,65 @@
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from datetime import datetime
+from pathlib import Path
 import json
 import random
-import time
 from urllib.parse import urlencode
 import requests
 from bs4 import BeautifulSoup
 from agno.tools import Toolkit
 from Tool.ContentCache import cache
+from Tool.HttpClient import http_client
+from Tool.RateLimiter import rate_limiter
+from Tool.SeenJobStore import seen_job_store
+from Tool.JobIdentity import dedupe_jobs, extract_job_id, load_result_jobs, normalize_job_url
 from agno.utils.log import logger
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+
+def _class_xpath(tag: str, class_name: str):
+    return etree.XPath(
+        f"(.//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')])[1]"
+    )
+
+
+def _first(elements: list):
+    return elements[0] if elements else None
+
+
+def _stripped_text(element) -> str:
+    # Same result as BeautifulSoup's get_text(strip=True): every text node is
+    # stripped and the pieces are joined without a separator.
+    return "".join(text.strip() for text in _TEXT_XPATH(element))
+
+
+if lxml_html is not None:
+    _CARD_XPATH = etree.XPath("//li")
+    _TITLE_XPATH = _class_xpath("*", "base-search-card__title")
+    _COMPANY_XPATH = _class_xpath("*", "base-search-card__subtitle")
+    _LOCATION_XPATH = _class_xpath("*", "job-search-card__location")
+    _TIME_XPATH = etree.XPath("(.//time)[1]")
+    _JOB_URL_XPATH = _class_xpath("a", "base-card__full-link")
+    _TEXT_XPATH = etree.XPath(".//text()")
+
+
 class LinkedInJobsToolkit(Toolkit):
 
     BASE_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?"
+    MAX_CONSECUTIVE_ERRORS = 3
     
     def __init__(self):
         super().__init__(name="linkedin_jobs")
         self.batch_size = 25
+        self.results_dir = Path("Jobs/Job_Results")
         self.register(self.search_jobs)
+        self.register(self.merge_job_results)
     
     def search_jobs(self, 
                    command: str = "", 
@@ -24,7 +67,9 @@ class LinkedInJobsToolkit(Toolkit):
                    location: str = "Türkiye", 
                    date_since_posted: str = "past week", 
                    job_type: str = "", 
-                   limit: int = 50) -> str:
+                   limit: int = 50,
+                   concurrent_pages: int = 1,
+                   incremental: bool = False) -> str:
         if command and command.strip():
             parsed_params = self._parse_command(command)
             keyword = parsed_params.get("keyword", keyword)
@@ -38,7 +83,13 @@ class LinkedInJobsToolkit(Toolkit):
         try:
             cache_key = f"linkedin_{keyword_clean}_{location_clean}_{date_since_posted}_{job_type}_{limit}"
             
-            cached_results = cache.get(cache_key)
+            seen_ids = None
+            if incremental:
+                query_key = f"{keyword_clean}|{location_clean}|{date_since_posted}|{job_type}".lower()
+                seen_ids = seen_job_store.get(query_key)
+                logger.info(f"Artımlı arama: bu sorgu için {len(seen_ids)} ilan daha önce görüldü")
+            
+            cached_results = None if incremental else cache.get(cache_key)
             if cached_results:
                 logger.info("Önbellekteki sonuçlar döndürülüyor")
                 return json.dumps(
@@ -46,57 +97,36 @@ class LinkedInJobsToolkit(Toolkit):
                     ensure_ascii=False
                 )
             
-            all_jobs = []
-            start = 0
-            consecutive_errors = 0
-            MAX_CONSECUTIVE_ERRORS = 3
-            
-            while True:
-                try:
-                    url = self._construct_url(
-                        keyword=keyword_clean,
-                        location=location_clean,
-                        date_since_posted=date_since_posted,
-                        job_type=job_type,
-                        start=start
-                    )
-                    
-                    jobs = self._fetch_job_batch(url)
-                    
-                    if not jobs:
-                        break
-                        
-                    all_jobs.extend(jobs)
-                    logger.info(f"{len(jobs)} iş ilanı getirildi. Toplam: {len(all_jobs)}")
-                    
-                    if limit and len(all_jobs) >= limit:
-                        all_jobs = all_jobs[:limit]
-                        break
-                        
-                    consecutive_errors = 0
-                    start += self.batch_size
-                    
-                    time.sleep(2 + random.random())
-                    
-                except Exception as e:
-                    consecutive_errors += 1
-                    logger.error(f"Sorgu hatası (deneme {consecutive_errors}): {str(e)}")
-                    
-                    if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
-                        logger.error("Maksimum ardışık hata sayısına ulaşıldı. İstek durduruldu.")
-                        break
-                        
-                    time.sleep(2 ** consecutive_errors)
+            build_url = partial(
+                self._construct_url,
+                keyword=keyword_clean,
+                location=location_clean,
+                date_since_posted=date_since_posted,
+                job_type=job_type
+            )
+            
+            # An incremental refresh usually stops on the first page of already
+            # seen postings, so prefetching a window would only waste requests.
+            if limit and concurrent_pages > 1 and not incremental:
+                all_jobs, failed_pages = self._paginate_concurrently(build_url, limit, concurrent_pages, seen_ids)
+            else:
+                all_jobs, failed_pages = self._paginate_sequentially(build_url, limit, seen_ids)
             
-            if all_jobs:
+            if incremental:
+                all_jobs = [job for job in all_jobs if extract_job_id(job.get("jobUrl", "")) not in seen_ids]
+                added = seen_job_store.add(query_key, [extract_job_id(job.get("jobUrl", "")) for job in all_jobs])
+                logger.info(f"Artımlı arama: {len(all_jobs)} yeni ilan, {added} kimlik kaydedildi")
+            elif all_jobs and not failed_pages:
                 cache.set(cache_key, all_jobs)
                 
             logger.info(f"LinkedIn aramasında {len(all_jobs)} sonuç bulundu")
             
-            return json.dumps(
-                {"results": all_jobs}, 
-                ensure_ascii=False
-            )
+            output = {"results": all_jobs}
+            if failed_pages:
+                # Partial results are returned but not cached.
+                logger.warning(f"LinkedIn sayfaları alınamadı (start={failed_pages}), sonuçlar eksik olabilir")
+                output["failed_pages"] = failed_pages
+            return json.dumps(output, ensure_ascii=False)
             
         except Exception as e:
             logger.error(f"LinkedIn iş araması hatası: {e}")
@@ -105,6 +135,135 @@ class LinkedInJobsToolkit(Toolkit):
                 ensure_ascii=False
             )
     
+    def _paginate_sequentially(self,
+                               build_url: Callable[..., str],
+                               limit: int,
+                               seen_ids: Optional[Set[str]] = None) -> Tuple[List[Dict[str, str]], List[int]]:
+        all_jobs = []
+        seen_keys: Set[str] = set()
+        start = 0
+        consecutive_errors = 0
+        
+        while True:
+            try:
+                jobs = self._fetch_job_batch(build_url(start=start))
+                
+                if not jobs:
+                    break
+                
+                if self._all_seen(jobs, seen_ids):
+                    logger.info(f"Sayfadaki tüm ilanlar daha önce görüldü (start={start}), sayfalama durduruldu")
+                    break
+                    
+                all_jobs.extend(dedupe_jobs(jobs, seen_keys))
+                logger.info(f"{len(jobs)} iş ilanı getirildi. Toplam (tekil): {len(all_jobs)}")
+                
+                if limit and len(all_jobs) >= limit:
+                    all_jobs = all_jobs[:limit]
+                    break
+                    
+                consecutive_errors = 0
+                start += self.batch_size
+                
+            except Exception as e:
+                consecutive_errors += 1
+                logger.error(f"Sorgu hatası (deneme {consecutive_errors}): {str(e)}")
+                
+                if consecutive_errors >= self.MAX_CONSECUTIVE_ERRORS:
+                    logger.error(f"Maksimum ardışık hata sayısına ulaşıldı (start={start}). İstek durduruldu.")
+                    return all_jobs, [start]
+        
+        return all_jobs, []
+    
+    def _paginate_concurrently(self,
+                               build_url: Callable[..., str],
+                               limit: int,
+                               window: int,
+                               seen_ids: Optional[Set[str]] = None) -> Tuple[List[Dict[str, str]], List[int]]:
+        starts = list(range(0, limit, self.batch_size))
+        all_jobs = []
+        seen_keys: Set[str] = set()
+        
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            for offset in range(0, len(starts), window):
+                window_starts = starts[offset:offset + window]
+                logger.info(f"{len(window_starts)} sayfa eşzamanlı getiriliyor (start={window_starts[0]})")
+                
+                pages = executor.map(lambda start: self._fetch_page_with_retries(build_url(start=start)), window_starts)
+                for start, jobs in zip(window_starts, pages):
+                    if jobs is None:
+                        logger.error(f"Sayfa alınamadı (start={start}), sayfalama durduruldu")
+                        return all_jobs[:limit], [start]
+                    if not jobs:
+                        logger.info(f"Boş sayfa (start={start}), sayfalama durduruldu")
+                        return all_jobs[:limit], []
+                    if self._all_seen(jobs, seen_ids):
+                        logger.info(f"Sayfadaki tüm ilanlar daha önce görüldü (start={start}), sayfalama durduruldu")
+                        return all_jobs[:limit], []
+                    all_jobs.extend(dedupe_jobs(jobs, seen_keys))
+                
+                logger.info(f"Toplam getirilen iş ilanı: {len(all_jobs)}")
+                if len(all_jobs) >= limit:
+                    break
+        
+        return all_jobs[:limit], []
+    
+    def _fetch_page_with_retries(self, url: str) -> Optional[List[Dict[str, str]]]:
+        # Every failure in _fetch_job_batch blocks the host in the rate limiter
+        # (Retry-After or 2, 4, 8 s), so the next attempt's acquire() waits out
+        # the backoff, shared by all pages of the window.
+        for attempt in range(1, self.MAX_CONSECUTIVE_ERRORS + 1):
+            try:
+                return self._fetch_job_batch(url)
+            except Exception as e:
+                logger.error(f"Sorgu hatası (deneme {attempt}): {str(e)}")
+        
+        logger.error("Maksimum deneme sayısına ulaşıldı. Sayfa alınamadı.")
+        return None
+    
+    def merge_job_results(self, output_path: str = "") -> str:
+        try:
+            result_files = sorted(
+                (path for path in self.results_dir.glob("*.json") if not path.name.startswith("merged_unique_")),
+                key=lambda path: path.stat().st_mtime,
+                reverse=True
+            )
+            if not result_files:
+                return json.dumps({"error": f"Birleştirilecek sonuç dosyası bulunamadı: {self.results_dir}"}, ensure_ascii=False)
+            
+            seen_keys: Set[str] = set()
+            merged_jobs = []
+            total_jobs = 0
+            for path in result_files:
+                jobs = load_result_jobs(path)
+                total_jobs += len(jobs)
+                merged_jobs.extend(dedupe_jobs(jobs, seen_keys))
+            
+            if not output_path:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                output_path = str(self.results_dir / f"merged_unique_{timestamp}.json")
+            
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump({"results": merged_jobs}, f, ensure_ascii=False, indent=2)
+            
+            logger.info(f"{len(result_files)} dosyadaki {total_jobs} ilan {len(merged_jobs)} tekil ilana indirildi: {output_path}")
+            return json.dumps({
+                "file_saved": output_path,
+                "source_files": len(result_files),
+                "total_jobs": total_jobs,
+                "unique_jobs": len(merged_jobs)
+            }, ensure_ascii=False)
+            
+        except Exception as e:
+            logger.error(f"Sonuç dosyası birleştirme hatası: {e}")
+            return json.dumps({"error": f"Sonuç dosyaları birleştirilemedi: {str(e)}"}, ensure_ascii=False)
+    
+    def _all_seen(self, jobs: List[Dict[str, str]], seen_ids: Optional[Set[str]]) -> bool:
+        if not seen_ids:
+            return False
+        return all(extract_job_id(job.get("jobUrl", "")) in seen_ids for job in jobs)
+    
     def _parse_command(self, command: str) -> Dict[str, str]:
         params = {
             "keyword": "software developer",
@@ -154,15 +313,77 @@ class LinkedInJobsToolkit(Toolkit):
             "Accept-Language": "en-US,en;q=0.9",
         }
         
+        rate_limiter.acquire(url)
+        try:
+            response = http_client.get(url, headers=headers, timeout=10)
+        except requests.exceptions.RequestException as e:
+            rate_limiter.record_error(url)
+            logger.error(f"HTTP isteği başarısız: {e}")
+            raise Exception(f"API isteği başarısız: {e}")
+        
+        rate_limiter.record_response(url, response)
         try:
-            response = requests.get(url, headers=headers, timeout=10)
             response.raise_for_status()
-            return self._parse_job_list(response.text)
         except requests.exceptions.RequestException as e:
             logger.error(f"HTTP isteği başarısız: {e}")
             raise Exception(f"API isteği başarısız: {e}")
+        
+        try:
+            return self._parse_job_list(response.text)
+        except Exception as e:
+            # A page LinkedIn served but we can not read (block page, truncated
+            # HTML) backs the host off just like a failed request.
+            rate_limiter.record_error(url)
+            logger.error(f"İlan listesi ayrıştırılamadı: {e}")
+            raise Exception(f"İlan listesi ayrıştırılamadı: {e}")
     
     def _parse_job_list(self, html: str) -> List[Dict[str, str]]:
+        if lxml_html is not None:
+            try:
+                return self._parse_job_list_lxml(html)
+            except Exception as err:
+                logger.warning(f"lxml ayrıştırma başarısız, BeautifulSoup ile deneniyor: {err}")
+        return self._parse_job_list_bs4(html)
+    
+    def _parse_job_list_lxml(self, html: str) -> List[Dict[str, str]]:
+        if not html or not html.strip():
+            return []
+        
+        root = lxml_html.fromstring(html)
+        job_elements = _CARD_XPATH(root)
+        logger.info(f"{len(job_elements)} iş ilanı elementi bulundu")
+        
+        jobs = []
+        for idx, element in enumerate(job_elements):
+            try:
+                title_el = _first(_TITLE_XPATH(element))
+                company_el = _first(_COMPANY_XPATH(element))
+                if title_el is None or company_el is None:
+                    continue
+                
+                location_el = _first(_LOCATION_XPATH(element))
+                time_el = _first(_TIME_XPATH(element))
+                job_url_el = _first(_JOB_URL_XPATH(element))
+                
+                job = self._build_job(
+                    position=_stripped_text(title_el),
+                    company=_stripped_text(company_el),
+                    location=_stripped_text(location_el) if location_el is not None else "",
+                    date=(time_el.get("datetime") or "") if time_el is not None else "",
+                    raw_url=(job_url_el.get("href") or "") if job_url_el is not None else ""
+                )
+                jobs.append(job)
+                
+                if idx < 5:
+                    logger.info(f"İş ilanı: {job['position']} @ {job['company']}")
+                    
+            except Exception as err:
+                logger.warning(f"İş ilanı ayrıştırma hatası (indeks {idx}): {err}")
+                
+        logger.info(f"Toplam {len(jobs)} geçerli iş ilanı ayrıştırıldı")
+        return jobs
+    
+    def _parse_job_list_bs4(self, html: str) -> List[Dict[str, str]]:
         soup = BeautifulSoup(html, "lxml")
         job_elements = soup.find_all("li")
         logger.info(f"{len(job_elements)} iş ilanı elementi bulundu")
@@ -179,13 +400,13 @@ class LinkedInJobsToolkit(Toolkit):
                 if not title_el or not company_el:
                     continue
 
-                job = {
-                    "position": title_el.get_text(strip=True),
-                    "company": company_el.get_text(strip=True),
-                    "location": location_el.get_text(strip=True) if location_el else "",
-                    "date": time_el["datetime"] if time_el and time_el.has_attr("datetime") else "",
-                    "jobUrl": job_url_el["href"] if job_url_el and job_url_el.has_attr("href") else "",
-                }
+                job = self._build_job(
+                    position=title_el.get_text(strip=True),
+                    company=company_el.get_text(strip=True),
+                    location=location_el.get_text(strip=True) if location_el else "",
+                    date=time_el["datetime"] if time_el and time_el.has_attr("datetime") else "",
+                    raw_url=job_url_el["href"] if job_url_el and job_url_el.has_attr("href") else ""
+                )
                 jobs.append(job)
                 
                 if idx < 5:
@@ -197,6 +418,16 @@ class LinkedInJobsToolkit(Toolkit):
         logger.info(f"Toplam {len(jobs)} geçerli iş ilanı ayrıştırıldı")
         return jobs
     
+    def _build_job(self, position: str, company: str, location: str, date: str, raw_url: str) -> Dict[str, str]:
+        return {
+            "position": position,
+            "company": company,
+            "location": location,
+            "date": date,
+            "jobUrl": normalize_job_url(raw_url),
+            "jobId": extract_job_id(raw_url) or "",
+        }
+    
     def _random_user_agent(self) -> str:
         agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/91.0.4472.124 Safari/537.36",
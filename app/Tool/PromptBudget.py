@@ -0,0 +1,129 @@
+from functools import lru_cache
+from typing import Any, List, Sequence
+import json
+import math
+import os
+import dotenv
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+dotenv.load_dotenv()
+
+
+EMPTY_MARKERS = frozenset({"", "belirtilmemiş", "belirtilmemis", "not specified", "n/a", "none", "null"})
+# Placeholders the template job analysis writes when a posting could not be fetched.
+TEMPLATE_MARKERS = frozenset({
+    "pozisyon başlığı (belirtilmemiş)", "şirket adı (belirtilmemiş)", "konum (belirtilmemiş)",
+    "teknoloji stack belirtilmemiş", "sorumluluklar belirtilmemiş", "nitelikler belirtilmemiş",
+    "yan haklar belirtilmemiş"
+})
+CLIP_LEVELS = [(8, 800), (5, 400), (3, 200), (1, 100)]
+
+
+def is_empty_value(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        text = value.strip().lower()
+        return text in EMPTY_MARKERS or text in TEMPLATE_MARKERS
+    if isinstance(value, (dict, list, tuple)):
+        return not value
+    return False
+
+
+def compact_data(data: Any) -> Any:
+    if isinstance(data, dict):
+        compacted = {key: compact_data(value) for key, value in data.items()}
+        return {key: value for key, value in compacted.items() if not is_empty_value(value)}
+    if isinstance(data, (list, tuple)):
+        compacted = [compact_data(item) for item in data]
+        return [item for item in compacted if not is_empty_value(item)]
+    if isinstance(data, str):
+        return data.strip()
+    return data
+
+
+def compact_json(data: Any) -> str:
+    return json.dumps(compact_data(data), ensure_ascii=False, separators=(",", ":"))
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    encoding = _encoding(model)
+    if encoding is None:
+        # Without tiktoken, UTF-8 bytes / 4 slightly overestimates English and
+        # tracks Turkish text (multi-byte letters) closer than characters do.
+        return math.ceil(len(text.encode("utf-8")) / 4)
+    return len(encoding.encode(text))
+
+
+class PromptSection:
+    def __init__(self, data: Any, optional_fields: Sequence[str] = (), priority: int = 1):
+        self.data = compact_data(data)
+        self.optional_fields = list(optional_fields)
+        self.priority = priority
+
+    def render(self) -> str:
+        return json.dumps(self.data, ensure_ascii=False, separators=(",", ":"))
+
+
+class PromptBudget:
+    def __init__(self, max_tokens: int = 6000, model: str = "gpt-4o"):
+        self.max_tokens = max_tokens
+        self.model = model
+
+    def fit(self, sections: List[PromptSection]) -> List[str]:
+        # Lower priority is trimmed first; on ties, later sections go first.
+        trim_order = sorted(reversed(sections), key=lambda section: section.priority)
+
+        for section in trim_order:
+            if self._within_budget(sections):
+                break
+            for field in section.optional_fields:
+                if isinstance(section.data, dict) and field in section.data:
+                    del section.data[field]
+                    if self._within_budget(sections):
+                        break
+
+        for max_items, max_chars in CLIP_LEVELS:
+            if self._within_budget(sections):
+                break
+            for section in trim_order:
+                section.data = self._clip(section.data, max_items, max_chars)
+                if self._within_budget(sections):
+                    break
+
+        rendered = [section.render() for section in sections]
+        tokens = count_tokens("\n".join(rendered), self.model)
+        if tokens > self.max_tokens:
+            print(f"⚠️ Prompt verisi bütçeyi aşıyor: {tokens}/{self.max_tokens} token")
+        return rendered
+
+    def _within_budget(self, sections: List[PromptSection]) -> bool:
+        return count_tokens("\n".join(section.render() for section in sections), self.model) <= self.max_tokens
+
+    def _clip(self, data: Any, max_items: int, max_chars: int) -> Any:
+        if isinstance(data, dict):
+            return {key: self._clip(value, max_items, max_chars) for key, value in data.items()}
+        if isinstance(data, list):
+            return [self._clip(item, max_items, max_chars) for item in data[:max_items]]
+        if isinstance(data, str) and len(data) > max_chars:
+            return data[:max_chars].rstrip() + "…"
+        return data
+
+
+prompt_budget = PromptBudget(int(os.getenv("CAREER_AGENT_PROMPT_TOKEN_BUDGET", "6000")))
@@ -0,0 +1,145 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import asyncio
+import threading
+import time
+from agno.utils.log import logger
+
+
+THROTTLE_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+class TokenBucket:
+    def __init__(self,
+                 rate: float = 1.0,
+                 min_rate: float = 0.1,
+                 max_rate: float = 4.0,
+                 burst: float = 2.0,
+                 additive_increase: float = 0.25,
+                 multiplicative_decrease: float = 0.5,
+                 max_backoff: float = 60.0):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self.max_backoff = max_backoff
+
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.consecutive_errors = 0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(wait, self.blocked_until - now)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.additive_increase)
+            self.consecutive_errors = 0
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.multiplicative_decrease)
+            self.tokens = min(self.tokens, 0)
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+    def on_error(self, retry_after: Optional[float] = None) -> None:
+        # A failed request without Retry-After (connection error, 4xx/5xx,
+        # unparsable page) blocks the host for 2, 4, 8... seconds, like the
+        # sleeps the pagination loop used to do itself.
+        with self._lock:
+            self.consecutive_errors += 1
+            backoff = retry_after or min(self.max_backoff, 2 ** self.consecutive_errors)
+        self.on_throttle(backoff)
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+
+class HostRateLimiter:
+    def __init__(self, **bucket_options):
+        self.bucket_options = bucket_options
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        wait = self.bucket_for(url).reserve()
+        if wait > 0:
+            logger.debug(f"⏳ Hız sınırı: {wait:.2f} sn bekleniyor ({urlparse(url).netloc})")
+            time.sleep(wait)
+
+    async def acquire_async(self, url: str) -> None:
+        wait = self.bucket_for(url).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record_response(self, url: str, response) -> None:
+        bucket = self.bucket_for(url)
+        if response.status_code >= 400:
+            bucket.on_error(self._parse_retry_after(response.headers.get("Retry-After")))
+        elif self._was_retried(response):
+            # urllib3 already waited between its retries; only slow down.
+            bucket.on_throttle()
+        else:
+            bucket.on_success()
+            return
+        logger.warning(
+            f"🐢 {urlparse(url).netloc} yavaşlatıldı (HTTP {response.status_code}), "
+            f"yeni hız: {bucket.rate:.2f} istek/sn"
+        )
+
+    def record_error(self, url: str) -> None:
+        bucket = self.bucket_for(url)
+        bucket.on_error()
+        logger.warning(
+            f"🐢 {urlparse(url).netloc} yavaşlatıldı (istek hatası), "
+            f"{bucket.consecutive_errors}. ardışık hata, yeni hız: {bucket.rate:.2f} istek/sn"
+        )
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(**self.bucket_options)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _was_retried(self, response) -> bool:
+        # urllib3 retries 429/5xx inside the pooled session; its history is the
+        # only trace that the endpoint pushed back before the final response.
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        history = getattr(retries, "history", None) or ()
+        return any(entry.status in THROTTLE_STATUSES for entry in history)
+
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+rate_limiter = HostRateLimiter()
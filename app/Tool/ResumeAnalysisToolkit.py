@@ -5,6 +5,8 @@ from agno.utils.log import logger
 from datetime import datetime
 from typing import Optional
 
+from Tool.DocumentTextExtractor import DocumentExtractionError, document_extractor
+
 
 class ResumeAnalysisToolkit(Toolkit):
     
@@ -115,26 +117,10 @@ class ResumeAnalysisToolkit(Toolkit):
             return error_msg
         
         try:
-            import PyPDF2
-            
-            with open(file_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page_num, page in enumerate(reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text.strip():
-                            text += page_text + "\n"
-                    except Exception as e:
-                        logger.warning(f"Sayfa {page_num + 1} okunamadı: {str(e)}")
-                        continue
-            
-            if not text.strip():
-                return "❌ PDF dosyasından metin çıkarılamadı. Dosya görüntü tabanlı olabilir."
-            
-            logger.info(f"✅ PDF başarıyla okundu: {len(text)} karakter")
-            return text
-                
+            return document_extractor.extract_pdf(str(file_path))
+        except DocumentExtractionError as e:
+            logger.error(str(e))
+            return f"❌ {e}"
         except Exception as e:
             error_msg = f"❌ PDF okuma hatası: {str(e)}"
             logger.error(error_msg)
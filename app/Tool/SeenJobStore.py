@@ -0,0 +1,86 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Set
+import json
+import os
+import threading
+from agno.utils.log import logger
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+class SeenJobStore:
+    def __init__(self, file_path: str = "Jobs/Search_History/seen_job_ids.json", max_ids_per_query: int = 5000):
+        self.file_path = Path(file_path)
+        if not self.file_path.is_absolute():
+            self.file_path = PROJECT_ROOT / self.file_path
+        self.max_ids_per_query = max_ids_per_query
+        self._lock = threading.Lock()
+
+    def get(self, query_key: str) -> Set[str]:
+        with self._lock:
+            return set(self._load().get(query_key, []))
+
+    def add(self, query_key: str, job_ids: Iterable[str]) -> int:
+        # Streamlit sessions and CLI runs share this file, so the merge is done
+        # on a fresh read under a file lock; otherwise the last writer would
+        # drop the IDs another process added in between.
+        with self._locked():
+            data = self._load()
+            known = data.get(query_key, [])
+            known_set = set(known)
+            new_ids = [job_id for job_id in job_ids if job_id and job_id not in known_set]
+            if not new_ids:
+                return 0
+
+            data[query_key] = (known + new_ids)[-self.max_ids_per_query:]
+            self._save(data)
+            return len(new_ids)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.file_path.with_suffix(".lock"), "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _load(self) -> Dict[str, List[str]]:
+        if not self.file_path.exists():
+            return {}
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"⚠️ Görülen ilan kaydı okunamadı, sıfırdan başlanıyor: {e}")
+            return {}
+
+    def _save(self, data: Dict[str, List[str]]) -> None:
+        tmp_path = self.file_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.file_path)
+
+
+seen_job_store = SeenJobStore()
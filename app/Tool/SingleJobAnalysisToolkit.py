@@ -2,6 +2,7 @@ import requests
 from bs4 import BeautifulSoup
 from agno.tools import Toolkit
 from agno.tools import tool
+from Tool.HttpClient import http_client
 
 
 class SingleJobAnalysisToolkit(Toolkit):
@@ -11,7 +12,7 @@ class SingleJobAnalysisToolkit(Toolkit):
     @tool
     def get_job_description_from_url(self, url: str) -> str:
         try:
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url, timeout=10)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
 
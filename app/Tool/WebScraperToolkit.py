@@ -1,16 +1,50 @@
+import asyncio
 import requests
 import json
 import re
 import random
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+from asyncio_throttle import Throttler
 from bs4 import BeautifulSoup
 from agno.tools import Toolkit
 from agno.utils.log import logger
 from Tool.ContentCache import cache
+from Tool.HttpClient import http_client
+from Tool.JobIdentity import dedupe_jobs, load_result_jobs, normalize_job_url
 import dotenv
 dotenv.load_dotenv()
 
 
 class WebScraperToolkit(Toolkit):
+
+    LINKEDIN_JOB_PLAN = {
+        "description": [
+            ".description__text",
+            ".show-more-less-html",
+            ".jobs-box__html-content",
+            ".jobs-description__content",
+            "[data-automation-id='jobPostingDescription']"
+        ],
+        "title": [
+            ".jobs-unified-top-card__job-title",
+            ".top-card-layout__title",
+            "h1"
+        ],
+        "company": [
+            ".jobs-unified-top-card__company-name",
+            ".topcard__org-name-link",
+            "[data-automation-id='jobPostingCompanyName']"
+        ],
+        "location": [
+            ".jobs-unified-top-card__bullet",
+            ".topcard__flavor--bullet",
+            "[data-automation-id='jobPostingLocation']"
+        ]
+    }
+
     def __init__(self):
         super().__init__(name="web_scraper")
         
@@ -18,6 +52,7 @@ class WebScraperToolkit(Toolkit):
         self.register(self.fetch_linkedin_job)
         self.register(self.search_linkedin_jobs)
         self.register(self.scrape_job_page)
+        self.register(self.scrape_job_file)
 
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 Safari/605.1.15",
@@ -37,27 +72,12 @@ class WebScraperToolkit(Toolkit):
             if cached:
                 logger.info(f"✅ Önbellekten döndürülüyor: {url[:50]}...")
                 return cached
-                
-            headers = {
-                "User-Agent": self._get_random_user_agent(),
-                "Accept": "text/html,application/xhtml+xml,application/xml",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "DNT": "1",
-                "Connection": "keep-alive"
-            }
-            
-            logger.info(f"🌐 URL çekiliyor: {url}")
             
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(self._fetch_html(url), "lxml")
             
             if selector and selector != "body":
-                elements = soup.select(selector)
-                content = "\n".join([el.get_text(separator="\n", strip=True) for el in elements])
-                logger.info(f"📄 CSS seçici '{selector}' ile {len(elements)} element bulundu")
+                content = self._select_text(soup, selector)
+                logger.info(f"📄 CSS seçici '{selector}' ile içerik çekildi: {len(content)} karakter")
             else:
                 content = soup.body.get_text(separator="\n", strip=True) if soup.body else "İçerik bulunamadı"
                 logger.info(f"📄 Body içeriği çekildi: {len(content)} karakter")
@@ -83,50 +103,24 @@ class WebScraperToolkit(Toolkit):
             logger.error(f"❌ {error_msg}")
             return json.dumps({"error": error_msg})
     
+    def extract_fields(self, url: str, plan: Dict[str, List[str]]) -> Dict[str, str]:
+        soup = BeautifulSoup(self._fetch_html(url), "lxml")
+        return self._resolve_plan(soup, plan)
+    
     def fetch_linkedin_job(self, job_url: str) -> str:
         try:
             logger.info(f"🔍 LinkedIn iş ilanı çekiliyor: {job_url}")
             
-            description_selectors = [
-                ".description__text",
-                ".show-more-less-html",
-                ".jobs-box__html-content",
-                ".jobs-description__content",
-                "[data-automation-id='jobPostingDescription']"
-            ]
-            
-            content = ""
-            for selector in description_selectors:
-                result = self.fetch_url_content(job_url, selector)
-                if not result.startswith('{"error"'):
-                    content += result + "\n\n"
-                    logger.info(f"✅ İçerik '{selector}' seçici ile çekildi")
-                    break
+            fields = self.extract_fields(job_url, self.LINKEDIN_JOB_PLAN)
+            content = fields.get("description", "")
             
             if content:
-                title_selectors = [
-                    ".jobs-unified-top-card__job-title",
-                    ".top-card-layout__title",
-                    "h1"
-                ]
-                
-                company_selectors = [
-                    ".jobs-unified-top-card__company-name",
-                    ".topcard__org-name-link",
-                    "[data-automation-id='jobPostingCompanyName']"
-                ]
+                content += "\n\n"
+                job_title = fields.get("title")
                 
-                location_selectors = [
-                    ".jobs-unified-top-card__bullet",
-                    ".topcard__flavor--bullet",
-                    "[data-automation-id='jobPostingLocation']"
-                ]
-                
-                job_title = self._try_selectors(job_url, title_selectors)
-                company = self._try_selectors(job_url, company_selectors)
-                location = self._try_selectors(job_url, location_selectors)
-                
-                if not job_title.startswith('{"error"'):
+                if job_title:
+                    company = fields.get("company", "Bulunamadı")
+                    location = fields.get("location", "Bulunamadı")
                     formatted_content = f"Pozisyon: {job_title}\n\nŞirket: {company}\n\nKonum: {location}\n\n{content}"
                     logger.info(f"✅ LinkedIn iş ilanı başarıyla parse edildi")
                     return formatted_content
@@ -137,20 +131,58 @@ class WebScraperToolkit(Toolkit):
                 logger.error(f"❌ {error_msg}")
                 return json.dumps({"error": error_msg})
                 
+        except requests.exceptions.RequestException as e:
+            error_msg = f"URL erişim hatası: {str(e)}"
+            logger.error(f"🌐 {error_msg}")
+            return json.dumps({"error": error_msg})
         except Exception as e:
             error_msg = f"LinkedIn iş ilanı çekme hatası: {str(e)}"
             logger.error(f"❌ {error_msg}")
             return json.dumps({"error": error_msg})
     
-    def _try_selectors(self, url: str, selectors: list) -> str:
-        for selector in selectors:
-            result = self.fetch_url_content(url, selector)
-            if not result.startswith('{"error"'):
-                logger.debug(f"✅ Seçici başarılı: {selector}")
-                return result
+    def _fetch_html(self, url: str, headers: Optional[dict] = None) -> str:
+        cache_key = f"html_{url}"
+        cached = cache.get(cache_key)
+        if cached:
+            logger.debug(f"✅ HTML önbellekten döndürülüyor: {url[:50]}...")
+            return cached
         
-        logger.warning(f"⚠️ Hiçbir seçici başarılı olmadı: {selectors}")
-        return "Bulunamadı"
+        if headers is None:
+            headers = {
+                "User-Agent": self._get_random_user_agent(),
+                "Accept": "text/html,application/xhtml+xml,application/xml",
+                "Accept-Language": "en-US,en;q=0.9",
+                "Accept-Encoding": "gzip, deflate, br",
+                "DNT": "1",
+                "Connection": "keep-alive"
+            }
+        
+        logger.info(f"🌐 URL çekiliyor: {url}")
+        
+        response = http_client.get(url, headers=headers, timeout=15)
+        response.raise_for_status()
+        
+        html = response.text
+        if html:
+            cache.set(cache_key, html)
+        return html
+    
+    def _select_text(self, soup, selector: str) -> str:
+        elements = soup.select(selector)
+        return "\n".join([el.get_text(separator="\n", strip=True) for el in elements]).strip()
+    
+    def _resolve_plan(self, soup, plan: Dict[str, List[str]]) -> Dict[str, str]:
+        fields = {}
+        for field, selectors in plan.items():
+            for selector in selectors:
+                text = self._select_text(soup, selector)
+                if text:
+                    fields[field] = text
+                    logger.debug(f"✅ '{field}' alanı '{selector}' seçici ile bulundu")
+                    break
+            else:
+                logger.warning(f"⚠️ '{field}' için hiçbir seçici başarılı olmadı: {selectors}")
+        return fields
     
     def search_linkedin_jobs(self, keyword: str = "software developer", location: str = "Turkey", limit: int = 10) -> str:
         try:
@@ -180,18 +212,86 @@ class WebScraperToolkit(Toolkit):
             return json.dumps({"error": error_msg})
         
     def scrape_job_page(self, url: str) -> str:
+        return json.dumps(self._scrape_job_details(url), ensure_ascii=False)
+    
+    def scrape_job_file(self, file_path: str, max_jobs: int = 0) -> str:
+        try:
+            urls = self.load_job_urls(file_path, max_jobs)
+            if not urls:
+                error_msg = f"Dosyada kazınacak iş ilanı URL'si bulunamadı: {file_path}"
+                logger.error(f"❌ {error_msg}")
+                return json.dumps({"error": error_msg}, ensure_ascii=False)
+            
+            logger.info(f"🕷️ {len(urls)} iş ilanı eşzamanlı kazınıyor: {file_path}")
+            results = self._run_coroutine(self._collect_job_pages(urls))
+            
+            order = {url: idx for idx, url in enumerate(urls)}
+            results.sort(key=lambda job: order.get(job.get("jobUrl"), len(order)))
+            
+            logger.info(f"✅ Toplu kazıma tamamlandı: {len(results)} ilan")
+            return json.dumps({"results": results}, ensure_ascii=False)
+            
+        except Exception as e:
+            error_msg = f"Toplu kazıma hatası: {str(e)}"
+            logger.error(f"❌ {error_msg}")
+            return json.dumps({"error": error_msg}, ensure_ascii=False)
+    
+    def load_job_urls(self, file_path: str, max_jobs: int = 0) -> List[str]:
+        jobs = [job for job in load_result_jobs(Path(file_path)) if job.get("jobUrl")]
+        unique_jobs = dedupe_jobs(jobs)
+        if len(unique_jobs) < len(jobs):
+            logger.info(f"🧹 {len(jobs) - len(unique_jobs)} tekrar eden ilan atlandı")
+        
+        urls = [normalize_job_url(job["jobUrl"]) for job in unique_jobs]
+        
+        if max_jobs and max_jobs > 0:
+            urls = urls[:max_jobs]
+        return urls
+    
+    async def scrape_job_pages(self,
+                               urls: List[str],
+                               max_per_host: int = 4,
+                               rate_limit: int = 5,
+                               period: float = 1.0) -> AsyncIterator[Dict[str, str]]:
+        throttler = Throttler(rate_limit=rate_limit, period=period)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        
+        async def scrape(url: str) -> Dict[str, str]:
+            host = urlparse(url).netloc.lower()
+            semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(max_per_host))
+            async with semaphore:
+                async with throttler:
+                    details = await asyncio.to_thread(self._scrape_job_details, url)
+            details["jobUrl"] = url
+            return details
+        
+        tasks = [asyncio.create_task(scrape(url)) for url in urls]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _collect_job_pages(self, urls: List[str]) -> List[Dict[str, str]]:
+        return [details async for details in self.scrape_job_pages(urls)]
+    
+    def _run_coroutine(self, coro):
+        # Tools may be invoked from inside agent.arun(), where the calling
+        # thread already owns a running loop; a private thread always works.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    
+    def _scrape_job_details(self, url: str) -> Dict[str, str]:
         try:
             if not url or not url.startswith("http"):
                 error_msg = "Geçersiz URL formatı"
                 logger.error(f"❌ {error_msg}")
-                return json.dumps({"error": error_msg})
+                return {"error": error_msg}
             
             logger.info(f"🕷️ İş ilanı sayfası kazınıyor: {url}")
             
-            response = requests.get(url, headers=self._get_enhanced_headers(), timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(self._fetch_html(url, self._get_enhanced_headers()), "lxml")
             
             job_details = {}
             
@@ -275,16 +375,16 @@ class WebScraperToolkit(Toolkit):
                     logger.debug(f"✅ {criteria_count} iş kriteri bulundu")
             
             logger.info(f"✅ İş ilanı başarıyla kazındı: {len(job_details)} alan")
-            return json.dumps(job_details, ensure_ascii=False)
+            return job_details
             
         except requests.RequestException as e:
             error_msg = f"HTTP istek hatası: {str(e)}"
             logger.error(f"🌐 {error_msg}")
-            return json.dumps({"error": error_msg})
+            return {"error": error_msg}
         except Exception as e:
             error_msg = f"Scraping hatası: {str(e)}"
             logger.error(f"❌ {error_msg}")
-            return json.dumps({"error": error_msg})
+            return {"error": error_msg}
     
     def _get_random_user_agent(self) -> str:
         agents = [
@@ -0,0 +1,10 @@
+import os
+import sys
+
+# Tool modules import each other as top-level `Tool.*`, the way streamlit_app
+# and the CLI agents load them with app/ on sys.path. Adding app/ here lets
+# `app.multi_agent` share those modules (and their singletons) instead of
+# loading a second copy under `app.Tool`.
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.append(_APP_DIR)
@@ -4,7 +4,6 @@ from textwrap import dedent
 from urllib.parse import urlparse
 from pathlib import Path
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.utils.log import logger
 import dotenv
 dotenv.load_dotenv()
@@ -12,6 +11,7 @@ from Tool.DocumentParserToolkit import DocumentParserToolkit
 from Tool.WebScraperToolkit import WebScraperToolkit
 from Tool.JobAnalysisToolkit import JobAnalysisToolkit
 from Tool.FileToolkit import FileToolkit    
+from Tool.AgentPool import PooledOpenAIChat, agent_pool
 import sys
 import re
 
@@ -44,7 +44,10 @@ def generate_filename_from_url(url: str) -> str:
 async def create_job_analysis_agent() -> Agent:
     doc_parser = DocumentParserToolkit()
     web_scraper = WebScraperToolkit()
-    job_analyzer = JobAnalysisToolkit()
+    model = PooledOpenAIChat(
+        id="gpt-4o",
+    )
+    job_analyzer = JobAnalysisToolkit(model_id=model.id)
     file_toolkit = FileToolkit()
     
     instructions = dedent("""\
@@ -62,7 +65,7 @@ async def create_job_analysis_agent() -> Agent:
         
         2. **İLANI ANALİZ ET:**
            - analyze_job_description() ile detaylı analiz yap
-           - extract_job_details() ile yapılandırılmış formata dönüştür
+           - extract_job_details() ile yapılandırılmış formata dönüştür (analyze_job_description() çıktısındaki cache_key değerini de geçir)
         
         3. **SONUÇLARI JSON OLARAK KAYDET:**
            - save_json(data=ANALIZ_SONUÇLARI, file_path="dosya.json") kullan
@@ -112,9 +115,7 @@ async def create_job_analysis_agent() -> Agent:
     """)
     
     return Agent(
-        model=OpenAIChat(
-            id="gpt-4o",
-        ),
+        model=model,
         tools=[doc_parser, web_scraper, job_analyzer, file_toolkit],
         instructions=instructions,
         markdown=True,
@@ -137,9 +138,8 @@ async def run_agent(message: str) -> str:
         
         logger.info(f"Job Analysis Agent başlatılıyor, sorgu: '{message}'")
         
-        agent = await create_job_analysis_agent()
-        
-        result = await agent.arun(message)
+        async with agent_pool.session("job_url_analysis", create_job_analysis_agent) as agent:
+            result = await agent.arun(message)
         
         return result
                 
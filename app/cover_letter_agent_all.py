@@ -5,14 +5,14 @@ import json
 from pathlib import Path
 from textwrap import dedent
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.tools import Toolkit
 from agno.tools.file import FileTools
 from agno.utils.log import logger
 from Tool.CoverLetterToolkit import CoverLetterToolkit
+from Tool.AgentPool import PooledOpenAIChat, agent_pool
 import dotenv
 import sys
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 
 os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -100,14 +100,132 @@ async def create_cover_letter_agent() -> Agent:
     """)
     
     return Agent(
-        model=OpenAIChat(id="gpt-4o"),
+        model=PooledOpenAIChat(id="gpt-4o"),
         tools=[cover_letter_toolkit, file_toolkit],
         instructions=instructions,
         markdown=True,
         show_tool_calls=True,
     )
 
-async def run_agent(job_data_path: str, resume_data_path: str, max_jobs: int = 3, output_path: Optional[str] = None) -> dict:
+async def generate_cover_letter(agent: Agent, job: dict, index: int, job_data_path: str, resume_data_path: str) -> Tuple[str, dict]:
+    try:
+        company_name = job.get("company", f"Şirket_{index + 1}")
+        position = job.get("position", f"Pozisyon_{index + 1}")
+        
+        if "analysis" in job:
+            analysis = job.get("analysis", {})
+            if analysis:
+                company_info = analysis.get("company_information", "")
+                if company_info and company_info != "Belirtilmemiş":
+                    company_name = company_info.split(",")[0].split(".")[0].strip() or company_name
+                
+                position_details = analysis.get("position_details", "")
+                if position_details and position_details != "Belirtilmemiş":
+                    position = position_details.split(",")[0].strip() or position
+        
+        def safe_ascii_encode(text):
+            if isinstance(text, str):
+                return text.encode('ascii', errors='replace').decode('ascii')
+            return str(text)
+        
+        safe_company = safe_ascii_encode(company_name)
+        safe_position = safe_ascii_encode(position)
+        
+        from datetime import datetime
+        ay_cevirileri = {
+            "January": "Ocak", "February": "Şubat", "March": "Mart", 
+            "April": "Nisan", "May": "Mayıs", "June": "Haziran",
+            "July": "Temmuz", "August": "Ağustos", "September": "Eylül", 
+            "October": "Ekim", "November": "Kasım", "December": "Aralık"
+        }
+        tarih_obj = datetime.now()
+        gun = tarih_obj.strftime("%d").lstrip("0")
+        ay_en = tarih_obj.strftime("%B")
+        yil = tarih_obj.strftime("%Y")
+        ay_tr = ay_cevirileri.get(ay_en, ay_en)
+        current_date = f"{gun} {ay_tr} {yil}"
+        
+        message = f"""
+        Create a professional cover letter:
+        
+        JOB INFORMATION:
+        Company: {safe_company}
+        Position: {safe_position}
+        
+        JOB DETAILS:
+        {json.dumps(job, ensure_ascii=True, indent=2)}
+        
+        CV ANALYSIS FILE: {resume_data_path}
+        
+        INSTRUCTIONS:
+        1. Use get_resume_analysis tool to read CV data
+        2. Compare job requirements with CV analysis
+        3. Create a high-quality cover letter in Turkish with this format:
+        
+        REQUIRED FORMAT:
+        {current_date}
+        
+        Sayin {safe_company} Insan Kaynaklari Ekibi,
+        
+        {safe_position} pozisyonu icin basvurumu sunmaktan buyuk memnuniyet duyuyorum. [Company hakkinda olumlu yorum ve bu sirkette calisma motivasyonu].
+        
+        [CV'deki en guclu deneyim alanini pozisyonla iliskilendirme]. [Teknik beceriler ve sayisal basari verileri]. [Bu deneyimin hedef pozisyonda saglayacagi avantajlar].
+        
+        [Ikinci guclu yon ve sirkete katki potansiyeli]. [Ogrenme ve gelisim istekliligi].
+        
+        Deneyimlerimi ve becerilerimi {safe_company}'da degerlendirme firsati bulmak icin bir gorusme talep ediyorum. Ilginiz ve zamaniniz icin tesekkur ederim.
+        
+        Saygilarimla,
+        [CV'den alinan ad soyad]
+        [CV'den alinan e-posta]
+        [CV'den alinan telefon]
+        
+        CRITICAL POINTS:
+        - Use personal info from CV (name, email, phone)
+        - Highlight technical skills matching the position
+        - Add numerical achievement data if available
+        - Keep between 300-500 words
+        - Return ONLY the letter text, nothing else
+        - Write in proper Turkish with correct characters (use ğ, ü, ş, ı, ö, ç)
+        """
+        
+        result = await agent.arun(message)
+        if hasattr(result, 'content'):
+            cover_letter = result.content
+        elif hasattr(result, 'response'):
+            cover_letter = result.response
+        else:
+            cover_letter = str(result)
+        
+        job_file = Path(job_data_path).stem
+        resume_file = Path(resume_data_path).stem
+        safe_company_filename = company_name.replace(" ", "_").replace("/", "_").replace("ğ", "g").replace("ü", "u").replace("ş", "s").replace("ı", "i").replace("ö", "o").replace("ç", "c")
+        safe_position_filename = position.replace(" ", "_").replace("/", "_").replace("ğ", "g").replace("ü", "u").replace("ş", "s").replace("ı", "i").replace("ö", "o").replace("ç", "c")
+        
+        output_file = f"Jobs/Cover_Letters/cover_letter_{safe_company_filename}_{safe_position_filename}_{job_file}_{resume_file}.txt"
+        
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(cover_letter)
+        
+        logger.info(f"Cover letter oluşturuldu: {company_name} - {position}")
+        return f"{company_name} - {position}", {
+            "content": cover_letter,
+            "file_path": output_file,
+            "company": company_name,
+            "position": position
+        }
+        
+    except Exception as e:
+        logger.error(f"İş {index + 1} için cover letter hatası: {e}")
+        return f"Hata_{index + 1}", {
+            "content": f"Bu iş için cover letter oluşturulamadı: {str(e)}",
+            "file_path": "",
+            "company": f"Hata_{index + 1}",
+            "position": "Hata"
+        }
+
+
+async def run_agent(job_data_path: str, resume_data_path: str, max_jobs: int = 3, output_path: Optional[str] = None, max_concurrency: int = 3) -> dict:
     try:
         logger.info(f"Cover letter ajanı başlatılıyor...")
         if output_path:
@@ -115,7 +233,6 @@ async def run_agent(job_data_path: str, resume_data_path: str, max_jobs: int = 3
         else:
             os.makedirs("Jobs/Cover_Letters", exist_ok=True)
         
-        agent = await create_cover_letter_agent()
         with open(job_data_path, 'r', encoding='utf-8') as f:
             job_data = json.load(f)
         
@@ -168,124 +285,16 @@ async def run_agent(job_data_path: str, resume_data_path: str, max_jobs: int = 3
         
         logger.info(f"Toplam {len(jobs)} iş için cover letter oluşturulacak")
         
-        cover_letters = {}
-        for i, job in enumerate(jobs):
-            try:
-                company_name = job.get("company", f"Şirket_{i+1}")
-                position = job.get("position", f"Pozisyon_{i+1}")
-                
-                if "analysis" in job:
-                    analysis = job.get("analysis", {})
-                    if analysis:
-                        company_info = analysis.get("company_information", "")
-                        if company_info and company_info != "Belirtilmemiş":
-                            company_name = company_info.split(",")[0].split(".")[0].strip() or company_name
-                        
-                        position_details = analysis.get("position_details", "")
-                        if position_details and position_details != "Belirtilmemiş":
-                            position = position_details.split(",")[0].strip() or position
-                
-                def safe_ascii_encode(text):
-                    if isinstance(text, str):
-                        return text.encode('ascii', errors='replace').decode('ascii')
-                    return str(text)
-                
-                safe_company = safe_ascii_encode(company_name)
-                safe_position = safe_ascii_encode(position)
-                
-                from datetime import datetime
-                ay_cevirileri = {
-                    "January": "Ocak", "February": "Şubat", "March": "Mart", 
-                    "April": "Nisan", "May": "Mayıs", "June": "Haziran",
-                    "July": "Temmuz", "August": "Ağustos", "September": "Eylül", 
-                    "October": "Ekim", "November": "Kasım", "December": "Aralık"
-                }
-                tarih_obj = datetime.now()
-                gun = tarih_obj.strftime("%d").lstrip("0")
-                ay_en = tarih_obj.strftime("%B")
-                yil = tarih_obj.strftime("%Y")
-                ay_tr = ay_cevirileri.get(ay_en, ay_en)
-                current_date = f"{gun} {ay_tr} {yil}"
-                
-                message = f"""
-                Create a professional cover letter:
-                
-                JOB INFORMATION:
-                Company: {safe_company}
-                Position: {safe_position}
-                
-                JOB DETAILS:
-                {json.dumps(job, ensure_ascii=True, indent=2)}
-                
-                CV ANALYSIS FILE: {resume_data_path}
-                
-                INSTRUCTIONS:
-                1. Use get_resume_analysis tool to read CV data
-                2. Compare job requirements with CV analysis
-                3. Create a high-quality cover letter in Turkish with this format:
-                
-                REQUIRED FORMAT:
-                {current_date}
-                
-                Sayin {safe_company} Insan Kaynaklari Ekibi,
-                
-                {safe_position} pozisyonu icin basvurumu sunmaktan buyuk memnuniyet duyuyorum. [Company hakkinda olumlu yorum ve bu sirkette calisma motivasyonu].
-                
-                [CV'deki en guclu deneyim alanini pozisyonla iliskilendirme]. [Teknik beceriler ve sayisal basari verileri]. [Bu deneyimin hedef pozisyonda saglayacagi avantajlar].
-                
-                [Ikinci guclu yon ve sirkete katki potansiyeli]. [Ogrenme ve gelisim istekliligi].
-                
-                Deneyimlerimi ve becerilerimi {safe_company}'da degerlendirme firsati bulmak icin bir gorusme talep ediyorum. Ilginiz ve zamaniniz icin tesekkur ederim.
-                
-                Saygilarimla,
-                [CV'den alinan ad soyad]
-                [CV'den alinan e-posta]
-                [CV'den alinan telefon]
-                
-                CRITICAL POINTS:
-                - Use personal info from CV (name, email, phone)
-                - Highlight technical skills matching the position
-                - Add numerical achievement data if available
-                - Keep between 300-500 words
-                - Return ONLY the letter text, nothing else
-                - Write in proper Turkish with correct characters (use ğ, ü, ş, ı, ö, ç)
-                """
-                
-                result = await agent.arun(message)
-                if hasattr(result, 'content'):
-                    cover_letter = result.content
-                elif hasattr(result, 'response'):
-                    cover_letter = result.response
-                else:
-                    cover_letter = str(result)
-                
-                job_file = Path(job_data_path).stem
-                resume_file = Path(resume_data_path).stem
-                safe_company_filename = company_name.replace(" ", "_").replace("/", "_").replace("ğ", "g").replace("ü", "u").replace("ş", "s").replace("ı", "i").replace("ö", "o").replace("ç", "c")
-                safe_position_filename = position.replace(" ", "_").replace("/", "_").replace("ğ", "g").replace("ü", "u").replace("ş", "s").replace("ı", "i").replace("ö", "o").replace("ç", "c")
-                
-                output_file = f"Jobs/Cover_Letters/cover_letter_{safe_company_filename}_{safe_position_filename}_{job_file}_{resume_file}.txt"
-                
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(cover_letter)
-                
-                cover_letters[f"{company_name} - {position}"] = {
-                    "content": cover_letter,
-                    "file_path": output_file,
-                    "company": company_name,
-                    "position": position
-                }
-                
-                logger.info(f"Cover letter oluşturuldu: {company_name} - {position}")
-                
-            except Exception as e:
-                logger.error(f"İş {i+1} için cover letter hatası: {e}")
-                cover_letters[f"Hata_{i+1}"] = {
-                    "content": f"Bu iş için cover letter oluşturulamadı: {str(e)}",
-                    "file_path": "",
-                    "company": f"Hata_{i+1}",
-                    "position": "Hata"
-                }
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def generate_with_pool(index: int, job: dict) -> Tuple[str, dict]:
+            # Every in-flight job checks out its own agent because agno agents
+            # keep per-run state; the pool hands back warm ones with a fresh session.
+            async with semaphore, agent_pool.session("cover_letter", create_cover_letter_agent) as pooled_agent:
+                return await generate_cover_letter(pooled_agent, job, index, job_data_path, resume_data_path)
+
+        results = await asyncio.gather(*(generate_with_pool(i, job) for i, job in enumerate(jobs)))
+        cover_letters = dict(results)
         
         logger.info(f"Toplam {len(cover_letters)} cover letter oluşturuldu")
         return {
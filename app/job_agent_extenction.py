@@ -4,11 +4,11 @@ from textwrap import dedent
 
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.utils.log import logger
 
 from Tool.FileToolkit import FileToolkit
 from Tool.LinkedInJobsToolkit import LinkedInJobsToolkit
+from Tool.AgentPool import PooledOpenAIChat, agent_pool
 import dotenv
 dotenv.load_dotenv()
 
@@ -48,7 +48,7 @@ async def create_agent() -> Agent:
     """)
     
     return Agent(
-        model=OpenAIChat(
+        model=PooledOpenAIChat(
             id="gpt-4o",
         ),
         tools=[linkedin_toolkit, file_toolkit],
@@ -63,9 +63,8 @@ async def run_agent(message: str) -> dict:
     try:
         logger.info(f"Agent başlatılıyor, sorgu: '{message}'")
         
-        agent = await create_agent()
-        
-        response = await agent.arun(message)
+        async with agent_pool.session("linkedin_search", create_agent) as agent:
+            response = await agent.arun(message)
         logger.info(f"Agent yanıtı alındı: {len(str(response))} karakter")
         
         return {
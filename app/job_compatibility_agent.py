@@ -16,11 +16,11 @@ if sys.platform.startswith('win'):
             pass
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.utils.log import logger
 
 from Tool.JobCompatibilityToolkit import JobCompatibilityToolkit
 from Tool.FileToolkit import FileToolkit
+from Tool.AgentPool import PooledOpenAIChat, agent_pool
 import dotenv
 dotenv.load_dotenv()
 
@@ -56,6 +56,12 @@ async def create_job_compatibility_agent() -> Agent:
         4. TÜM İŞLER ANALİZİ:
            - analyze_compatibility(job_data=job_data, resume_data=cv_data)
            - save_compatibility_report(compatibility_report=report, candidate_name="aday_adı")
+           - analyze_compatibility ilanları yerel olarak ön puanlar ve sadece en uygun top_k (varsayılan 5) ilanı analize dahil eder
+
+        5. ÇOK SAYIDA İLAN İÇİN TEK TEK ANALİZ:
+           - Önce shortlist_jobs(job_analysis_data=job_data, resume_data=cv_data, top_k=5) ile yerel ön puanlama yap
+           - Sadece shortlist içindeki job_index değerleri için analyze_single_job_compatibility çağır
+           - filtered_out listesindeki ilanları LLM ile analiz etme
         
         DETAYLI PUANLAMA KRİTERLERİ (10 üzerinden):
 
@@ -195,7 +201,7 @@ async def create_job_compatibility_agent() -> Agent:
     return Agent(
         name="Is_Uygunluk_Test_Uzmani",
         role="is_ilani_cv_uygunluk_analizi_ve_skorlama",
-        model=OpenAIChat(
+        model=PooledOpenAIChat(
             id="gpt-4o",
             api_key=os.getenv("OPENAI_API_KEY")
         ),
@@ -210,9 +216,8 @@ async def run_agent(message: str) -> None:
     try:
         logger.info(f"İş uygunluğu test agent'ı başlatılıyor: '{message}'")
         
-        agent = await create_job_compatibility_agent()
-        
-        await agent.aprint_response(message, stream=True)
+        async with agent_pool.session("job_compatibility", create_job_compatibility_agent) as agent:
+            await agent.aprint_response(message, stream=True)
                 
     except Exception as e:
         logger.error(f"İş uygunluğu agent hatası: {e}")
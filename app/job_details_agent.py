@@ -7,11 +7,11 @@ from pathlib import Path
 from textwrap import dedent
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.utils.log import logger
 from Tool.WebScraperToolkit import WebScraperToolkit
 from Tool.FileToolkit import FileToolkit
 from Tool.JobAnalysisToolkit import JobAnalysisToolkit
+from Tool.AgentPool import PooledOpenAIChat, agent_pool
 import dotenv
 dotenv.load_dotenv()
 
@@ -24,7 +24,8 @@ logging.basicConfig(
 async def create_job_file_analyzer_agent() -> Agent:
     file_toolkit = FileToolkit()
     web_scraper_toolkit = WebScraperToolkit()
-    job_analysis_toolkit = JobAnalysisToolkit()
+    model = PooledOpenAIChat(id="gpt-4o")
+    job_analysis_toolkit = JobAnalysisToolkit(model_id=model.id)
     
     instructions = dedent("""\
         Sen özel bir LinkedIn İş Dosyası Analizi asistanısın. JSON dosyalarındaki LinkedIn iş ilanlarını okur, 
@@ -121,7 +122,8 @@ async def create_job_file_analyzer_agent() -> Agent:
         - Tarih formatı: YYYYMMDD_HHMMSS kullanılmalıdır
         
         **LİNKEDİN SPESİFİK YAKLAŞIM:**
-        - scrape_job_page() kullan (LinkedIn için optimize)
+        - Dosyadaki tüm ilanlar için scrape_job_file(file_path=..., max_jobs=X) kullan; URL'leri eşzamanlı kazır ve sonuçları dosya sırasıyla döndürür
+        - Tek bir URL için scrape_job_page() kullan (LinkedIn için optimize)
         - fetch_linkedin_job() backup olarak kullan
         - URL'ler genelde LinkedIn jobs formatında olacak
         - Hata durumunda da fetch_url_content() son çare
@@ -142,7 +144,7 @@ async def create_job_file_analyzer_agent() -> Agent:
         
         **ZORUNLU ADIMLAR:**
         1. read_json ile JSON dosyasını oku
-        2. Her URL için scrape_job_page() kullan
+        2. scrape_job_file() ile tüm URL'leri tek seferde kazı (hata dönen ilanlar için scrape_job_page() ile tekrar dene)
         3. Analiz sonuçlarını organize et
         4. save_json ile ZORUNLU olarak kaydet
         5. Kayıt başarısını doğrula ve bildir
@@ -153,7 +155,7 @@ async def create_job_file_analyzer_agent() -> Agent:
     """)
     
     return Agent(
-        model=OpenAIChat(id="gpt-4o"),
+        model=model,
         tools=[file_toolkit, web_scraper_toolkit, job_analysis_toolkit],
         instructions=instructions,
         markdown=True,
@@ -165,8 +167,8 @@ async def run_file_analysis_agent(message: str) -> dict:
     try:
         logger.info(f"Starting LinkedIn file analysis agent, query: '{message}'")
         
-        agent = await create_job_file_analyzer_agent()
-        response = await agent.arun(message)
+        async with agent_pool.session("job_file_analyzer", create_job_file_analyzer_agent) as agent:
+            response = await agent.arun(message)
         
         logger.info(f"Agent response received: {len(str(response))} characters")
         
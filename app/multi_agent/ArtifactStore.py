@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class ArtifactStore:
+    def __init__(self, persist_async: bool = True):
+        self.persist_async = persist_async
+        self._artifacts: Dict[Path, Any] = {}
+        self._pending: Dict[Path, Future] = {}
+        self._failed: List[Path] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifact-writer") if persist_async else None
+
+    def put(self, path: Path, data: Any) -> Path:
+        path = Path(path)
+        # Serialize now so later changes to `data` can not leak into the durable copy.
+        payload = json.dumps(data, ensure_ascii=False, indent=4) if path.suffix == ".json" else str(data)
+        with self._lock:
+            self._artifacts[path] = data
+            if self._executor is None:
+                self._write(path, payload)
+            else:
+                self._pending[path] = self._executor.submit(self._write, path, payload)
+        return path
+
+    def get(self, path: Path) -> Optional[Any]:
+        path = Path(path)
+        with self._lock:
+            if path in self._artifacts:
+                return self._artifacts[path]
+
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f) if path.suffix == ".json" else f.read()
+        with self._lock:
+            self._artifacts.setdefault(path, data)
+        return data
+
+    def flush(self, paths: Optional[Iterable[Path]] = None) -> List[Path]:
+        # Several workflows can share one store, so a caller may flush just the
+        # paths it wrote and only sees its own failed writes.
+        wanted = None if paths is None else {Path(path) for path in paths}
+        with self._lock:
+            pending = [(path, future) for path, future in self._pending.items() if wanted is None or path in wanted]
+            for path, _ in pending:
+                del self._pending[path]
+
+        for path, future in pending:
+            try:
+                future.result()
+            except OSError as e:
+                print(f"⚠️ Çıktı dosyası yazılamadı: {path} ({e})")
+                with self._lock:
+                    self._failed.append(path)
+
+        with self._lock:
+            failed = [path for path in self._failed if wanted is None or path in wanted]
+            self._failed = [path for path in self._failed if path not in failed]
+        return failed
+
+    def scoped(self) -> "ArtifactScope":
+        return ArtifactScope(self)
+
+    def _write(self, path: Path, payload: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+
+class ArtifactScope:
+    def __init__(self, store: ArtifactStore):
+        self.store = store
+        self._paths: Set[Path] = set()
+        self._lock = threading.Lock()
+
+    def put(self, path: Path, data: Any) -> Path:
+        path = self.store.put(path, data)
+        with self._lock:
+            self._paths.add(path)
+        return path
+
+    def get(self, path: Path) -> Optional[Any]:
+        return self.store.get(path)
+
+    def flush(self) -> List[Path]:
+        with self._lock:
+            paths, self._paths = self._paths, set()
+        return self.store.flush(paths)
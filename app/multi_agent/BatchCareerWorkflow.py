@@ -0,0 +1,121 @@
+import re
+import uuid
+import asyncio
+from pathlib import Path
+from typing import List, Optional
+
+from app.multi_agent.ArtifactStore import ArtifactStore
+from app.multi_agent.CareerAgentTeamCoordinator import CareerAgentTeamCoordinator
+from app.multi_agent.MultiAgentResumeAnalysisAgent import MultiAgentResumeAnalysisAgent
+from Tool.AgentPool import agent_pool
+from Tool.JobIdentity import normalize_job_url
+
+
+class BatchCareerWorkflow:
+    def __init__(self, max_concurrency: int = 4, batch_id: Optional[str] = None):
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_id = batch_id or str(uuid.uuid4())
+        self.artifacts = ArtifactStore()
+
+    async def run(self, resume_file_path: str, job_urls: List[str]) -> dict:
+        job_urls = self._unique_urls(job_urls)
+        print(f"\n---\nBatch ID: {self.batch_id}\n---\n")
+        print(f"Toplu iş akışı başlatılıyor: {len(job_urls)} ilan, CV Dosyası: {resume_file_path}")
+
+        artifacts = self.artifacts.scoped()
+        resume_workflow_id = f"{self.batch_id}-resume"
+        resume_agent = agent_pool.checkout("resume_analysis_agent", MultiAgentResumeAnalysisAgent, session_id=resume_workflow_id)
+        resume_agent.workflow_id = resume_workflow_id
+        resume_agent.artifact_store = artifacts
+        print("\n--- CV Analizi (tüm ilanlar için bir kez) ---")
+        try:
+            resume_result = await asyncio.to_thread(resume_agent.analyze_and_save_resume, resume_file_path)
+        finally:
+            agent_pool.release("resume_analysis_agent", resume_agent)
+        resume_data = artifacts.get(self._resume_analysis_path(resume_workflow_id))
+        if "Hata:" in resume_result or not resume_data:
+            await asyncio.to_thread(artifacts.flush)
+            return {"status": "failed", "message": "CV Analizi Başarısız", "batch_id": self.batch_id,
+                    "resume_analysis": resume_result, "ranking": []}
+
+        job_workflow_ids = [f"{self.batch_id}-{index + 1:03d}" for index in range(len(job_urls))]
+        # Each job workflow finds the shared CV analysis as an already valid checkpoint.
+        for workflow_id in job_workflow_ids:
+            artifacts.put(self._resume_analysis_path(workflow_id), resume_data)
+        unsaved = await asyncio.to_thread(artifacts.flush)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(*(
+            self._run_job(semaphore, workflow_id, job_url, resume_file_path)
+            for workflow_id, job_url in zip(job_workflow_ids, job_urls)
+        ))
+
+        ranking = self._rank(results)
+        summary = {
+            "status": "success" if any(entry["status"] == "success" for entry in ranking) else "failed",
+            "message": f"{sum(entry['status'] == 'success' for entry in ranking)}/{len(ranking)} ilan için iş akışı tamamlandı.",
+            "batch_id": self.batch_id,
+            "resume_file_path": resume_file_path,
+            "resume_analysis": resume_result,
+            "ranking": ranking
+        }
+        summary_path = artifacts.put(Path(f"Jobs/Job_Compatibility/batch_{self.batch_id}_summary.json"), summary)
+        unsaved += await asyncio.to_thread(artifacts.flush)
+        if unsaved:
+            summary["unsaved_files"] = [str(path) for path in unsaved]
+
+        print(f"\n--- Toplu İş Akışı Tamamlandı: {summary['message']} Özet: {summary_path} ---")
+        return summary
+
+    async def _run_job(self, semaphore: asyncio.Semaphore, workflow_id: str, job_url: str, resume_file_path: str) -> dict:
+        async with semaphore:
+            coordinator = CareerAgentTeamCoordinator(workflow_id=workflow_id, artifact_store=self.artifacts)
+            try:
+                result = await coordinator.run_full_workflow(job_url, resume_file_path)
+            except Exception as e:
+                result = {"status": "failed", "message": f"Hata: İş akışı çalıştırılamadı. Detaylar: {e}", "details": {}}
+
+        job_data = self.artifacts.get(Path(f"Jobs/Job_Analysis/{workflow_id}_single_job_analysis.json")) or {}
+        compatibility_data = self.artifacts.get(Path(f"Jobs/Job_Compatibility/compatibility_{workflow_id}.json")) or {}
+        cover_letter_path = Path(f"Jobs/Cover_Letters/{workflow_id}_cover_letter.txt")
+
+        return {
+            "workflow_id": workflow_id,
+            "job_url": job_url,
+            "status": result["status"],
+            "message": result["message"],
+            "job_title": job_data.get("job_title", "Belirtilmemiş"),
+            "company_name": job_data.get("company_name", "Belirtilmemiş"),
+            "overall_score": compatibility_data.get("overall_score"),
+            "score": self._parse_score(compatibility_data.get("overall_score")),
+            "cover_letter_path": str(cover_letter_path) if result["status"] == "success" else None,
+            "unsaved_files": result.get("unsaved_files", [])
+        }
+
+    def _rank(self, results: List[dict]) -> List[dict]:
+        ranking = sorted(
+            results,
+            key=lambda entry: (entry["status"] != "success", entry["score"] is None, -(entry["score"] or 0))
+        )
+        for rank, entry in enumerate(ranking, start=1):
+            entry["rank"] = rank
+        return ranking
+
+    def _parse_score(self, value) -> Optional[float]:
+        if isinstance(value, (int, float)):
+            return float(value)
+        match = re.search(r"\d+(?:[.,]\d+)?", str(value or ""))
+        return float(match.group().replace(",", ".")) if match else None
+
+    def _unique_urls(self, job_urls: List[str]) -> List[str]:
+        seen = set()
+        unique_urls = []
+        for job_url in job_urls:
+            key = normalize_job_url(job_url.strip())
+            if key and key not in seen:
+                seen.add(key)
+                unique_urls.append(job_url.strip())
+        return unique_urls
+
+    def _resume_analysis_path(self, workflow_id: str) -> Path:
+        return Path(f"Jobs/Resume_Analysis/{workflow_id}_resume_analysis.json")
@@ -1,38 +1,49 @@
 import uuid
+import json
 import asyncio
 from pathlib import Path
+from typing import Iterable, Optional
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.team.team import Team
 
 from app.multi_agent.SingleJobAnalysisAgent import SingleJobAnalysisAgent
 from app.multi_agent.MultiAgentResumeAnalysisAgent import MultiAgentResumeAnalysisAgent
 from app.multi_agent.MultiAgentJobCompatibilityAgent import MultiAgentJobCompatibilityAgent
 from app.multi_agent.MultiAgentCoverLetterAgent import MultiAgentCoverLetterAgent
+from app.multi_agent.ArtifactStore import ArtifactStore
+from app.multi_agent.WorkflowEngine import WorkflowEngine, WorkflowStep, is_valid_artifact
+from Tool.AgentPool import PooledOpenAIChat, agent_pool
+
+MEMBER_AGENTS = (
+    ("single_job_analysis_agent", SingleJobAnalysisAgent),
+    ("resume_analysis_agent", MultiAgentResumeAnalysisAgent),
+    ("job_compatibility_agent", MultiAgentJobCompatibilityAgent),
+    ("cover_letter_agent", MultiAgentCoverLetterAgent),
+)
 
 class CareerAgentTeamCoordinator(Team):
-    def __init__(self, **kwargs):
-        self.workflow_id = str(uuid.uuid4())
+    def __init__(self, workflow_id: Optional[str] = None, artifact_store: Optional[ArtifactStore] = None, **kwargs):
+        self.workflow_id = workflow_id or str(uuid.uuid4())
         self.job_url = None
         self.resume_file_path = None
 
-        self.single_job_analysis_agent = SingleJobAnalysisAgent(workflow_id=self.workflow_id)
-        self.resume_analysis_agent = MultiAgentResumeAnalysisAgent(workflow_id=self.workflow_id)
-        self.job_compatibility_agent = MultiAgentJobCompatibilityAgent(workflow_id=self.workflow_id)
-        self.cover_letter_agent = MultiAgentCoverLetterAgent(workflow_id=self.workflow_id)
+        # Steps hand their parsed outputs to each other through this store;
+        # the files under Jobs/ are written in the background as a durable record.
+        # Writes go through a scope so flush() only reports this workflow's
+        # failures when a batch shares one store between coordinators.
+        self.artifacts = (artifact_store or ArtifactStore()).scoped()
 
-        members = [
-            self.single_job_analysis_agent,
-            self.resume_analysis_agent,
-            self.job_compatibility_agent,
-            self.cover_letter_agent
-        ]
+        # Member agents come from the shared agent pool only while a run is in
+        # progress (see _persisted), so workflows reuse warm agents and clients.
+        for attribute, _ in MEMBER_AGENTS:
+            setattr(self, attribute, None)
+        self.workflow = self._build_workflow()
 
         super().__init__(
             name="Career Agent Coordinator Team",
             mode="coordinate",
-            model=OpenAIChat(id="gpt-4o"),
-            members=members,
+            model=PooledOpenAIChat(id="gpt-4o"),
+            members=[],
             instructions=[
                 "Sen bir Kariyer Danışmanı Takım Koordinatörüsün. Kullanıcının sağladığı iş ilanı URL'sini ve CV dosyasını kullanarak otomatik, profesyonel ve end-to-end iş başvuru süreci yürütürsün.",
                 "",
@@ -63,7 +74,7 @@ class CareerAgentTeamCoordinator(Team):
                 "- **Hedef**: Yüksek kaliteli, kişiselleştirilmiş cover letter oluşturmak",
                 "- **Çıktı**: Professional cover letter with company/position customization",
                 "- **Kalite Standardı**: 300-500 kelime, 5-paragraf yapısı, value proposition",
-                "- **Dosya**: `cover_letter_{workflow_id}.txt`",
+                "- **Dosya**: `{workflow_id}_cover_letter.txt`",
                 "",
                 "## WORKFLOW KALİTE KONTROL",
                 "",
@@ -136,45 +147,100 @@ class CareerAgentTeamCoordinator(Team):
             **kwargs
         )
 
-    async def run_full_workflow(self, job_url: str, resume_file_path: str) -> dict:
+    async def run_full_workflow(self, job_url: str, resume_file_path: str, force: Iterable[str] = ()) -> dict:
         self.job_url = job_url
         self.resume_file_path = resume_file_path
 
         print(f"\n---\nWorkflow ID: {self.workflow_id}\n---\n")
         print(f"İş akışı başlatılıyor: İş URL'si: {self.job_url}, CV Dosyası: {self.resume_file_path}")
 
-        results = {}
-
-        print("\n--- 1. Adım: İş İlanı Analizi Başlatılıyor ---")
-        job_analysis_result = self.single_job_analysis_agent.analyze_and_save_job_description(self.job_url)
-        print(f"İş İlanı Analizi Sonucu: {job_analysis_result}")
-        results["job_analysis"] = job_analysis_result
-        if "Hata:" in job_analysis_result:
-            return {"status": "failed", "message": "İş İlanı Analizi Başarısız", "details": results}
-
-        print("\n--- 2. Adım: CV Analizi Başlatılıyor ---")
-        resume_analysis_result = self.resume_analysis_agent.analyze_and_save_resume(self.resume_file_path)
-        print(f"CV Analizi Sonucu: {resume_analysis_result}")
-        results["resume_analysis"] = resume_analysis_result
-        if "Hata:" in resume_analysis_result:
-            return {"status": "failed", "message": "CV Analizi Başarısız", "details": results}
-
-        print("\n--- 3. Adım: İş Uygunluk Analizi Başlatılıyor ---")
-        compatibility_result = self.job_compatibility_agent.analyze_and_save_compatibility()
-        print(f"İş Uygunluk Analizi Sonucu: {compatibility_result}")
-        results["job_compatibility"] = compatibility_result
-        if "Hata:" in compatibility_result:
-            return {"status": "failed", "message": "İş Uygunluk Analizi Başarısız", "details": results}
-
-        print("\n--- 4. Adım: Kapak Mektubu Oluşturma Başlatılıyor ---")
-        cover_letter_result = self.cover_letter_agent.generate_and_save_cover_letter()
-        print(f"Kapak Mektubu Oluşturma Sonucu: {cover_letter_result}")
-        results["cover_letter"] = cover_letter_result
-        if "Hata:" in cover_letter_result:
-            return {"status": "failed", "message": "Kapak Mektubu Oluşturma Başarısız", "details": results}
-
-        print("\n--- İş Akışı Başarıyla Tamamlandı! ---")
-        return {"status": "success", "message": "Tüm iş akışı başarıyla tamamlandı.", "details": results}
+        result = await self._persisted(self.workflow.run(force=force))
+        if result["status"] == "success":
+            print("\n--- İş Akışı Başarıyla Tamamlandı! ---")
+        return result
+
+    async def retry_step(self, step_name: str, job_url: Optional[str] = None, resume_file_path: Optional[str] = None) -> dict:
+        self.job_url = job_url or self.job_url
+        self.resume_file_path = resume_file_path or self.resume_file_path
+        return await self._persisted(self.workflow.run_step(step_name))
+
+    async def _persisted(self, run) -> dict:
+        self._checkout_members()
+        try:
+            result = await run
+        finally:
+            self._release_members()
+            failed_writes = await asyncio.to_thread(self.artifacts.flush)
+        if failed_writes:
+            result["unsaved_files"] = [str(path) for path in failed_writes]
+        return result
+
+    def _checkout_members(self) -> None:
+        members = []
+        for attribute, agent_class in MEMBER_AGENTS:
+            agent = agent_pool.checkout(attribute, agent_class, session_id=self.workflow_id)
+            agent.workflow_id = self.workflow_id
+            agent.artifact_store = self.artifacts
+            setattr(self, attribute, agent)
+            members.append(agent)
+        self.members = members
+
+    def _release_members(self) -> None:
+        for attribute, _ in MEMBER_AGENTS:
+            agent = getattr(self, attribute)
+            if agent is not None:
+                agent_pool.release(attribute, agent)
+                setattr(self, attribute, None)
+        self.members = []
+
+    def _build_workflow(self) -> WorkflowEngine:
+        job_analysis_path = Path(f"Jobs/Job_Analysis/{self.workflow_id}_single_job_analysis.json")
+        resume_analysis_path = Path(f"Jobs/Resume_Analysis/{self.workflow_id}_resume_analysis.json")
+        compatibility_path = Path(f"Jobs/Job_Compatibility/compatibility_{self.workflow_id}.json")
+        cover_letter_path = Path(f"Jobs/Cover_Letters/{self.workflow_id}_cover_letter.txt")
+
+        return WorkflowEngine([
+            WorkflowStep(
+                "job_analysis",
+                lambda: self.single_job_analysis_agent.analyze_and_save_job_description(self.job_url),
+                outputs=[job_analysis_path],
+                failure_message="İş İlanı Analizi Başarısız",
+                validate=self._is_job_analysis_current
+            ),
+            WorkflowStep(
+                "resume_analysis",
+                lambda: self.resume_analysis_agent.analyze_and_save_resume(self.resume_file_path),
+                outputs=[resume_analysis_path],
+                failure_message="CV Analizi Başarısız",
+                validate=self._is_resume_analysis_current
+            ),
+            WorkflowStep(
+                "job_compatibility",
+                lambda: self.job_compatibility_agent.analyze_and_save_compatibility(),
+                outputs=[compatibility_path],
+                depends_on=["job_analysis", "resume_analysis"],
+                failure_message="İş Uygunluk Analizi Başarısız"
+            ),
+            WorkflowStep(
+                "cover_letter",
+                lambda: self.cover_letter_agent.generate_and_save_cover_letter(),
+                outputs=[cover_letter_path],
+                depends_on=["job_analysis", "resume_analysis", "job_compatibility"],
+                failure_message="Kapak Mektubu Oluşturma Başarısız"
+            )
+        ])
+
+    def _is_job_analysis_current(self, path: Path) -> bool:
+        if not is_valid_artifact(path):
+            return False
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get("job_url") == self.job_url
+
+    def _is_resume_analysis_current(self, path: Path) -> bool:
+        if not is_valid_artifact(path):
+            return False
+        resume_path = Path(self.resume_file_path or "")
+        return not resume_path.is_file() or path.stat().st_mtime >= resume_path.stat().st_mtime
 
 if __name__ == "__main__":
     example_job_url = "https://www.linkedin.com/jobs/view/some-job-id"
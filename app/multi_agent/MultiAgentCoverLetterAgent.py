@@ -1,15 +1,18 @@
-import json
 from pathlib import Path
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.tools.reasoning import ReasoningTools
+from typing import Optional
+
+from app.multi_agent.ArtifactStore import ArtifactStore
+from Tool.AgentPool import PooledOpenAIChat
+from Tool.PromptBudget import PromptSection, prompt_budget
 
 class MultiAgentCoverLetterAgent(Agent):
-    def __init__(self, workflow_id: str = None, **kwargs):
+    def __init__(self, workflow_id: str = None, artifact_store: Optional[ArtifactStore] = None, **kwargs):
         super().__init__(
             name="Multi-Agent Cover Letter Agent",
             role="İş ilanı analizi, CV analizi ve uygunluk raporunu kullanarak kişiselleştirilmiş bir ön yazı (cover letter) oluşturur.",
-            model=OpenAIChat(id="gpt-4o"),
+            model=PooledOpenAIChat(id="gpt-4o"),
             tools=[
                 ReasoningTools(add_instructions=True)
             ],
@@ -171,16 +174,16 @@ class MultiAgentCoverLetterAgent(Agent):
             **kwargs
         )
         self.workflow_id = workflow_id
+        self.artifact_store = artifact_store or ArtifactStore(persist_async=False)
 
     def load_job_analysis(self) -> dict:
         try:
             job_file_path = Path(f"Jobs/Job_Analysis/{self.workflow_id}_single_job_analysis.json")
-            if job_file_path.exists():
-                with open(job_file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
+            data = self.artifact_store.get(job_file_path)
+            if data is None:
                 print(f"İş analizi dosyası bulunamadı: {job_file_path}")
                 return {}
+            return data
         except Exception as e:
             print(f"İş analizi dosyası okuma hatası: {e}")
             return {}
@@ -188,12 +191,11 @@ class MultiAgentCoverLetterAgent(Agent):
     def load_resume_analysis(self) -> dict:
         try:
             resume_file_path = Path(f"Jobs/Resume_Analysis/{self.workflow_id}_resume_analysis.json")
-            if resume_file_path.exists():
-                with open(resume_file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
+            data = self.artifact_store.get(resume_file_path)
+            if data is None:
                 print(f"CV analizi dosyası bulunamadı: {resume_file_path}")
                 return {}
+            return data
         except Exception as e:
             print(f"CV analizi dosyası okuma hatası: {e}")
             return {}
@@ -201,12 +203,11 @@ class MultiAgentCoverLetterAgent(Agent):
     def load_compatibility_report(self) -> dict:
         try:
             compatibility_file_path = Path(f"Jobs/Job_Compatibility/compatibility_{self.workflow_id}.json")
-            if compatibility_file_path.exists():
-                with open(compatibility_file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
+            data = self.artifact_store.get(compatibility_file_path)
+            if data is None:
                 print(f"Uygunluk raporu dosyası bulunamadı: {compatibility_file_path}")
                 return {}
+            return data
         except Exception as e:
             print(f"Uygunluk raporu dosyası okuma hatası: {e}")
             return {}
@@ -227,17 +228,26 @@ class MultiAgentCoverLetterAgent(Agent):
         if not compatibility_data:
             return "Hata: Uygunluk raporu dosyası bulunamadı veya okunamadı."
 
+        job_json, resume_json, compatibility_json = prompt_budget.fit([
+            PromptSection(job_data, optional_fields=["note", "job_url", "company_website", "headquarters", "benefits"]),
+            PromptSection(resume_data, optional_fields=["certifications", "languages"]),
+            PromptSection(compatibility_data, priority=0, optional_fields=[
+                "note", "system_error", "detailed_analysis", "weaknesses", "technical_skills_score", "experience_score",
+                "education_score", "sector_experience_score", "language_skills_score", "soft_skills_score"
+            ])
+        ])
+
         cover_letter_prompt = f"""
         Aşağıdaki bilgileri kullanarak profesyonel ve kişiselleştirilmiş bir kapak mektubu yaz:
 
         İŞ İLANI ANALİZİ:
-        {json.dumps(job_data, ensure_ascii=False, indent=2)}
+        {job_json}
 
         CV ANALİZİ:
-        {json.dumps(resume_data, ensure_ascii=False, indent=2)}
+        {resume_json}
 
         UYGUNLUK RAPORU:
-        {json.dumps(compatibility_data, ensure_ascii=False, indent=2)}
+        {compatibility_json}
 
         KAPAK MEKTUBU KURALLARI:
         1. **Başlık ve Tarih**: Güncel tarih ve doğru format
@@ -284,12 +294,8 @@ class MultiAgentCoverLetterAgent(Agent):
             
             cover_letter_content = response.content if hasattr(response, 'content') else str(response)
             
-            output_dir = Path(f"Jobs/Cover_Letters/")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_file_path = output_dir / f"{self.workflow_id}_cover_letter.txt"
-
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                f.write(cover_letter_content)
+            output_file_path = Path(f"Jobs/Cover_Letters/{self.workflow_id}_cover_letter.txt")
+            self.artifact_store.put(output_file_path, cover_letter_content)
 
             print(f"Kapak mektubu kaydedildi: {output_file_path}")
             return f"Kapak mektubu başarıyla oluşturuldu ve '{output_file_path}' konumuna kaydedildi."
@@ -1,15 +1,19 @@
 import json
 from pathlib import Path
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.tools.reasoning import ReasoningTools
+from typing import Optional
+
+from app.multi_agent.ArtifactStore import ArtifactStore
+from Tool.AgentPool import PooledOpenAIChat
+from Tool.PromptBudget import PromptSection, prompt_budget
 
 class MultiAgentJobCompatibilityAgent(Agent):
-    def __init__(self, workflow_id: str = None, **kwargs):
+    def __init__(self, workflow_id: str = None, artifact_store: Optional[ArtifactStore] = None, **kwargs):
         super().__init__(
             name="Multi-Agent Job Compatibility Agent",
             role="İş ilanı analizi ile CV analizi arasında detaylı karşılaştırma yaparak adayın işe uygunluğunu kapsamlı bir şekilde değerlendirir ve profesyonel rapor oluşturur.",
-            model=OpenAIChat(id="gpt-4o"),
+            model=PooledOpenAIChat(id="gpt-4o"),
             tools=[
                 ReasoningTools(add_instructions=True)
             ],
@@ -71,16 +75,16 @@ class MultiAgentJobCompatibilityAgent(Agent):
             **kwargs
         )
         self.workflow_id = workflow_id
+        self.artifact_store = artifact_store or ArtifactStore(persist_async=False)
 
     def load_job_analysis(self) -> dict:
         try:
             job_file_path = Path(f"Jobs/Job_Analysis/{self.workflow_id}_single_job_analysis.json")
-            if job_file_path.exists():
-                with open(job_file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
+            data = self.artifact_store.get(job_file_path)
+            if data is None:
                 print(f"İş analizi dosyası bulunamadı: {job_file_path}")
                 return {}
+            return data
         except Exception as e:
             print(f"İş analizi dosyası okuma hatası: {e}")
             return {}
@@ -88,12 +92,11 @@ class MultiAgentJobCompatibilityAgent(Agent):
     def load_resume_analysis(self) -> dict:
         try:
             resume_file_path = Path(f"Jobs/Resume_Analysis/{self.workflow_id}_resume_analysis.json")
-            if resume_file_path.exists():
-                with open(resume_file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
+            data = self.artifact_store.get(resume_file_path)
+            if data is None:
                 print(f"CV analizi dosyası bulunamadı: {resume_file_path}")
                 return {}
+            return data
         except Exception as e:
             print(f"CV analizi dosyası okuma hatası: {e}")
             return {}
@@ -111,15 +114,20 @@ class MultiAgentJobCompatibilityAgent(Agent):
         if not resume_data:
             return "Hata: CV analizi dosyası bulunamadı veya okunamadı."
 
+        job_json, resume_json = prompt_budget.fit([
+            PromptSection(job_data, optional_fields=["note", "job_url", "company_website", "headquarters", "company_description", "benefits"]),
+            PromptSection(resume_data, optional_fields=["personal_info"])
+        ])
+
         compatibility_prompt = f"""
         Sen bir İş Uygunluk Analizi Uzmanısın. Görevin, iş ilanı analizini CV analizi ile karşılaştırarak 
         adayın işe uygunluğunu 10 üzerinden puanlamak.
 
         İŞ İLANI ANALİZİ:
-        {json.dumps(job_data, ensure_ascii=False, indent=2)}
+        {job_json}
 
         CV ANALİZİ:
-        {json.dumps(resume_data, ensure_ascii=False, indent=2)}
+        {resume_json}
 
         DETAYLI PUANLAMA KRİTERLERİ (10 üzerinden):
 
@@ -214,12 +222,8 @@ class MultiAgentJobCompatibilityAgent(Agent):
             
             compatibility_data = json.loads(response_content)
             
-            output_dir = Path(f"Jobs/Job_Compatibility/")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_file_path = output_dir / f"compatibility_{self.workflow_id}.json"
-
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                json.dump(compatibility_data, f, ensure_ascii=False, indent=4)
+            output_file_path = Path(f"Jobs/Job_Compatibility/compatibility_{self.workflow_id}.json")
+            self.artifact_store.put(output_file_path, compatibility_data)
 
             print(f"Detaylı uygunluk raporu kaydedildi: {output_file_path}")
             return f"Uygunluk analizi başarıyla tamamlandı ve '{output_file_path}' konumuna kaydedildi."
@@ -261,15 +265,12 @@ class MultiAgentJobCompatibilityAgent(Agent):
             ],
             "detailed_analysis": "Otomatik uygunluk analizi sistem hatası nedeniyle tamamlanamadı. Bu template rapor, sistem sorununu göstermektedir. Gerçek analiz için iş ilanı ve CV verilerinin doğru formatta yüklendiğinden ve LLM'nin erişebildiğinden emin olunmalıdır. Manual değerlendirme yapılması önerilir.",
             "note": "Bu bir template raporudur. Gerçek analiz için geçerli veri ve çalışan sistem gereklidir.",
-            "system_error": "LLM uygunluk analizi başarısız oldu"
+            "system_error": "LLM uygunluk analizi başarısız oldu",
+            "fallback": True
         }
         
-        output_dir = Path(f"Jobs/Job_Compatibility/")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_file_path = output_dir / f"compatibility_{self.workflow_id}.json"
-
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            json.dump(template_data, f, ensure_ascii=False, indent=4)
+        output_file_path = Path(f"Jobs/Job_Compatibility/compatibility_{self.workflow_id}.json")
+        self.artifact_store.put(output_file_path, template_data)
 
         print(f"Template uygunluk raporu kaydedildi: {output_file_path}")
         return f"Uygunluk analizi otomatik yapılamadı, detaylı template rapor '{output_file_path}' konumuna kaydedildi." 
\ No newline at end of file
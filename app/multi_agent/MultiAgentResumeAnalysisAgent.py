@@ -1,16 +1,19 @@
 import json
-import PyPDF2
 from pathlib import Path
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.tools.reasoning import ReasoningTools
+from typing import Optional, Tuple
+
+from app.multi_agent.ArtifactStore import ArtifactStore
+from Tool.AgentPool import PooledOpenAIChat
+from Tool.DocumentTextExtractor import document_extractor
 
 class MultiAgentResumeAnalysisAgent(Agent):
-    def __init__(self, workflow_id: str = None, **kwargs):
+    def __init__(self, workflow_id: str = None, artifact_store: Optional[ArtifactStore] = None, **kwargs):
         super().__init__(
             name="Multi-Agent Resume Analysis Agent",
             role="Kullanıcının özgeçmiş dosyasını analiz eder ve yapılandırılmış bir JSON çıktısı oluşturur.",
-            model=OpenAIChat(id="gpt-4o"),
+            model=PooledOpenAIChat(id="gpt-4o"),
             tools=[
                 ReasoningTools(add_instructions=True) 
             ],
@@ -175,36 +178,35 @@ class MultiAgentResumeAnalysisAgent(Agent):
             **kwargs
         )
         self.workflow_id = workflow_id
+        self.artifact_store = artifact_store or ArtifactStore(persist_async=False)
 
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-                return text.strip()
+            return document_extractor.extract_pdf(pdf_path).strip()
         except Exception as e:
             print(f"PDF okuma hatası: {e}")
             try:
                 import pdfplumber
                 with pdfplumber.open(pdf_path) as pdf:
-                    text = ""
-                    for page in pdf.pages:
-                        text += page.extract_text() or ""
-                    return text.strip()
+                    return "\n".join(page.extract_text() or "" for page in pdf.pages).strip()
             except:
                 return f"Error: Could not read PDF file {pdf_path}"
 
-    def analyze_and_save_resume(self, resume_path: str) -> str:
+    def analyze_and_save_resume(self, resume_path: str, resume_text: Optional[str] = None) -> str:
+        return self.analyze_resume_with_status(resume_path, resume_text)[1]
+
+    def analyze_resume_with_status(self, resume_path: str, resume_text: Optional[str] = None) -> Tuple[str, str]:
+        # Status is "success", "fallback" (template analysis saved) or "error";
+        # callers that batch CVs need it without parsing the message text.
         if not self.workflow_id:
-            return "Hata: Workflow ID belirlenmemiş."
+            return "error", "Hata: Workflow ID belirlenmemiş."
 
-        print(f"CV dosyası okunuyor: {resume_path}")
-        resume_text = self.extract_text_from_pdf(resume_path)
+        if resume_text is None:
+            print(f"CV dosyası okunuyor: {resume_path}")
+            resume_text = self.extract_text_from_pdf(resume_path)
         
         if "Error:" in resume_text:
-            return resume_text
+            return "error", resume_text
 
         analysis_prompt = f"""
         Aşağıdaki CV metnini analiz et ve belirtilen JSON formatında çıkar:
@@ -291,25 +293,21 @@ class MultiAgentResumeAnalysisAgent(Agent):
             
             resume_data = self.validate_and_fix_format(resume_data)
             
-            output_dir = Path(f"Jobs/Resume_Analysis/")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_file_path = output_dir / f"{self.workflow_id}_resume_analysis.json"
-
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                json.dump(resume_data, f, ensure_ascii=False, indent=4)
+            output_file_path = Path(f"Jobs/Resume_Analysis/{self.workflow_id}_resume_analysis.json")
+            self.artifact_store.put(output_file_path, resume_data)
 
             print(f"CV analizi kaydedildi: {output_file_path}")
-            return f"CV başarıyla analiz edildi ve '{output_file_path}' konumuna kaydedildi."
+            return "success", f"CV başarıyla analiz edildi ve '{output_file_path}' konumuna kaydedildi."
             
         except json.JSONDecodeError as e:
             print(f"JSON ayrıştırma hatası: {e}")
             print(f"LLM yanıtı: {response_content[:500]}...")
             
-            return self.create_template_resume_analysis(resume_path, resume_text)
+            return "fallback", self.create_template_resume_analysis(resume_path, resume_text)
             
         except Exception as e:
             print(f"CV analizi sırasında beklenmeyen hata: {e}")
-            return f"Hata: CV analizi yapılamadı. Detaylar: {e}"
+            return "error", f"Hata: CV analizi yapılamadı. Detaylar: {e}"
 
     def validate_and_fix_format(self, data: dict) -> dict:
         required_structure = {
@@ -372,20 +370,16 @@ class MultiAgentResumeAnalysisAgent(Agent):
             "languages": ["Dil bilgisi bulunamadı"],
             "certifications": [],
             "strengths": ["CV analizi otomatik yapılamadı"],
-            "note": "Bu bir template analizdir. CV metni otomatik olarak işlenemedi."
+            "note": "Bu bir template analizdir. CV metni otomatik olarak işlenemedi.",
+            "fallback": True
         }
         
         output_dir = Path(f"Jobs/Resume_Analysis/")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
         output_file_path = output_dir / f"{self.workflow_id}_resume_analysis.json"
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            json.dump(template_data, f, ensure_ascii=False, indent=4)
+        self.artifact_store.put(output_file_path, template_data)
         
         raw_file_path = output_dir / f"{self.workflow_id}_resume_raw.txt"
-        with open(raw_file_path, 'w', encoding='utf-8') as f:
-            f.write(f"CV Path: {resume_path}\n\n")
-            f.write(f"Extracted Text:\n{resume_text}")
+        self.artifact_store.put(raw_file_path, f"CV Path: {resume_path}\n\nExtracted Text:\n{resume_text}")
         
         print(f"Template CV analizi kaydedildi: {output_file_path}")
         return f"CV otomatik analiz edilemedi, template analiz '{output_file_path}' konumuna kaydedildi." 
\ No newline at end of file
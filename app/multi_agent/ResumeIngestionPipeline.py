@@ -0,0 +1,134 @@
+import re
+import json
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.multi_agent.ArtifactStore import ArtifactStore
+from app.multi_agent.MultiAgentResumeAnalysisAgent import MultiAgentResumeAnalysisAgent
+from app.multi_agent.WorkflowEngine import is_valid_artifact
+from Tool.AgentPool import agent_pool
+from Tool.DocumentTextExtractor import document_extractor
+from Tool.ResumeAnalysisToolkit import ResumeAnalysisToolkit
+
+RESUME_SUFFIXES = (".pdf", ".doc", ".docx", ".txt")
+
+
+class ResumeIngestionPipeline:
+    def __init__(self,
+                 resume_dir: str = "Jobs/Resumes",
+                 manifest_path: str = "Jobs/.cache/resume_ingestion.json",
+                 max_concurrency: int = 3):
+        self.resume_dir = Path(resume_dir)
+        self.manifest_path = Path(manifest_path)
+        self.max_concurrency = max(1, max_concurrency)
+        self.artifacts = ArtifactStore()
+        self.resume_toolkit = ResumeAnalysisToolkit()
+
+    async def run(self, force: bool = False) -> dict:
+        manifest = self._load_manifest()
+        resume_files = self.discover()
+        digests = dict(zip(resume_files, await asyncio.gather(
+            *(asyncio.to_thread(document_extractor.content_digest, path) for path in resume_files)
+        )))
+
+        pending = [path for path in resume_files if force or not self._is_current(path, digests[path], manifest)]
+        skipped = [path.name for path in resume_files if path not in pending]
+        print(f"CV klasörü tarandı: {len(resume_files)} dosya, {len(pending)} yeni/değişmiş, {len(skipped)} atlandı")
+
+        # Extraction first: PDFs fan out over the extractor's process pool, so
+        # every CV's text is ready before the slower LLM stage starts.
+        extracted = await asyncio.gather(*(asyncio.to_thread(self._extract_text, path) for path in pending))
+        failed = {path.name: error for path, (_, error) in zip(pending, extracted) if error}
+        ready = [(path, text) for path, (text, error) in zip(pending, extracted) if not error]
+
+        analyzed: List[str] = []
+        if ready:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            results = await asyncio.gather(*(self._analyze(semaphore, path, text) for path, text in ready))
+            unsaved = {str(path) for path in await asyncio.to_thread(self.artifacts.flush)}
+
+            for (path, _), (analysis_path, status, result) in zip(ready, results):
+                if status != "success":
+                    failed[path.name] = result
+                elif str(analysis_path) in unsaved:
+                    failed[path.name] = f"Hata: Analiz dosyası yazılamadı: {analysis_path}"
+                else:
+                    manifest[path.name] = {
+                        "sha256": digests[path],
+                        "analysis_file": str(analysis_path),
+                        "analyzed_at": datetime.now().isoformat()
+                    }
+                    analyzed.append(path.name)
+
+            self.artifacts.put(self.manifest_path, manifest)
+            await asyncio.to_thread(self.artifacts.flush)
+
+        summary = {
+            "status": "failed" if failed and not analyzed else "success",
+            "message": f"{len(analyzed)} CV analiz edildi, {len(skipped)} CV değişmediği için atlandı, {len(failed)} CV başarısız.",
+            "analyzed": analyzed,
+            "skipped": skipped,
+            "failed": failed,
+            "analysis_files": {name: manifest[name]["analysis_file"] for name in analyzed + skipped}
+        }
+        print(f"\n--- Toplu CV Analizi Tamamlandı: {summary['message']} ---")
+        return summary
+
+    def discover(self) -> List[Path]:
+        if not self.resume_dir.exists():
+            return []
+        return sorted(path for path in self.resume_dir.iterdir() if path.is_file() and path.suffix.lower() in RESUME_SUFFIXES)
+
+    def analysis_path(self, resume_file: Path) -> Path:
+        return Path(f"Jobs/Resume_Analysis/{self._workflow_id(resume_file)}_resume_analysis.json")
+
+    async def _analyze(self, semaphore: asyncio.Semaphore, resume_file: Path, resume_text: str) -> Tuple[Path, str, str]:
+        # The semaphore is the LLM concurrency limit; each CV checks out its own
+        # pooled agent because an agent serves one CV at a time.
+        async with semaphore:
+            workflow_id = self._workflow_id(resume_file)
+            agent = agent_pool.checkout("resume_analysis_agent", MultiAgentResumeAnalysisAgent, session_id=workflow_id)
+            try:
+                agent.workflow_id = workflow_id
+                agent.artifact_store = self.artifacts
+                print(f"LLM ile CV analiz ediliyor: {resume_file.name}")
+                status, result = await asyncio.to_thread(agent.analyze_resume_with_status, str(resume_file), resume_text)
+            except Exception as e:
+                status, result = "error", f"Hata: CV analizi yapılamadı. Detaylar: {e}"
+            finally:
+                agent_pool.release("resume_analysis_agent", agent)
+        return self.analysis_path(resume_file), status, result
+
+    def _extract_text(self, resume_file: Path) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            if resume_file.suffix.lower() == ".pdf":
+                text = document_extractor.extract_pdf(str(resume_file), parallel=document_extractor.max_workers > 1)
+            else:
+                text = self.resume_toolkit.parse_resume(str(resume_file))
+                if text.startswith("❌"):
+                    return None, text
+            if not text.strip():
+                return None, f"Hata: {resume_file.name} dosyasından metin çıkarılamadı."
+            return text.strip(), None
+        except Exception as e:
+            return None, f"Hata: {resume_file.name} okunamadı. Detaylar: {e}"
+
+    def _is_current(self, resume_file: Path, digest: str, manifest: Dict[str, dict]) -> bool:
+        entry = manifest.get(resume_file.name)
+        return bool(entry) and entry.get("sha256") == digest and is_valid_artifact(Path(entry.get("analysis_file", "")))
+
+    def _workflow_id(self, resume_file: Path) -> str:
+        return "ingest_" + re.sub(r"[^\w-]+", "_", resume_file.name)
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ CV manifest dosyası okunamadı, tüm CV'ler yeniden analiz edilecek: {e}")
+            return {}
@@ -3,18 +3,46 @@ import requests
 from bs4 import BeautifulSoup
 from pathlib import Path
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.tools.reasoning import ReasoningTools
 import time
 from urllib.parse import urlparse
+from typing import FrozenSet, Optional
+
+from app.multi_agent.ArtifactStore import ArtifactStore
+from Tool.AgentPool import PooledOpenAIChat
+from Tool.ContentExtractor import ContentExtractor
+from Tool.HttpClient import http_client
+from Tool.JobIdentity import normalize_job_url
+from Tool.KeywordMatcher import KeywordMatcher
+from Tool.LLMResponseCache import llm_cache
+
+
+JOB_KEYWORDS = frozenset([
+    'responsibility', 'responsibilities', 'requirement', 'requirements', 
+    'qualification', 'qualifications', 'experience', 'skill', 'skills',
+    'position', 'role', 'job', 'candidate', 'apply', 'company',
+    'salary', 'benefit', 'benefits', 'education', 'degree'
+])
+
+TECH_KEYWORDS = frozenset([
+    'python', 'sql', 'java', 'javascript', 'react', 'node', 'django',
+    'machine learning', 'data science', 'analytics', 'database',
+    'aws', 'azure', 'cloud', 'api', 'programming', 'software',
+    'engineering', 'development', 'framework'
+])
+
+content_matcher = KeywordMatcher(JOB_KEYWORDS | TECH_KEYWORDS)
+content_extractor = ContentExtractor(content_matcher, min_length=200)
 
 
 class SingleJobAnalysisAgent(Agent):
-    def __init__(self, workflow_id: str = None, **kwargs):
+    JOB_ANALYSIS_PROMPT_VERSION = "1"
+
+    def __init__(self, workflow_id: str = None, artifact_store: Optional[ArtifactStore] = None, **kwargs):
         super().__init__(
             name="Single Job Analysis Agent",
             role="Verilen tek bir iş ilanı URL'sini detaylı bir şekilde analiz eder, anahtar kelimeleri, sorumlulukları ve gereksinimleri çıkarır.",
-            model=OpenAIChat(id="gpt-4o"),
+            model=PooledOpenAIChat(id="gpt-4o"),
             tools=[
                 ReasoningTools(add_instructions=True)
             ],
@@ -225,11 +253,14 @@ class SingleJobAnalysisAgent(Agent):
             **kwargs
         )
         self.workflow_id = workflow_id
+        self.artifact_store = artifact_store or ArtifactStore(persist_async=False)
 
     def calculate_content_quality_score(self, content: str) -> float:
+        return self.score_content_features(len(content), content_matcher.find(content))
+
+    def score_content_features(self, length: int, found_keywords: FrozenSet[str]) -> float:
         score = 0.0
         
-        length = len(content)
         if 500 <= length <= 3000:
             score += 0.3
         elif 200 <= length <= 5000:
@@ -237,43 +268,16 @@ class SingleJobAnalysisAgent(Agent):
         elif length > 100:
             score += 0.1
         
-        job_keywords = [
-            'responsibility', 'responsibilities', 'requirement', 'requirements', 
-            'qualification', 'qualifications', 'experience', 'skill', 'skills',
-            'position', 'role', 'job', 'candidate', 'apply', 'company',
-            'salary', 'benefit', 'benefits', 'education', 'degree'
-        ]
-        
-        content_lower = content.lower()
-        keyword_count = sum(1 for keyword in job_keywords if keyword in content_lower)
+        keyword_count = len(found_keywords & JOB_KEYWORDS)
         score += min(keyword_count * 0.05, 0.4)
         
-        tech_keywords = [
-            'python', 'sql', 'java', 'javascript', 'react', 'node', 'django',
-            'machine learning', 'data science', 'analytics', 'database',
-            'aws', 'azure', 'cloud', 'api', 'programming', 'software',
-            'engineering', 'development', 'framework'
-        ]
-        
-        tech_count = sum(1 for tech in tech_keywords if tech in content_lower)
+        tech_count = len(found_keywords & TECH_KEYWORDS)
         score += min(tech_count * 0.03, 0.3)
         
         return min(score, 1.0)
 
     def smart_div_analysis(self, soup) -> str:
-        divs = soup.find_all('div')
-        best_content = ""
-        best_score = 0
-        
-        for div in divs:
-            text = div.get_text(separator=' ', strip=True)
-            if len(text) > 200:
-                score = self.calculate_content_quality_score(text)
-                if score > best_score:
-                    best_score = score
-                    best_content = text
-        
-        return best_content
+        return content_extractor.best_block(soup, self.score_content_features, tag_name='div')
 
     def scrape_linkedin_job_page(self, url: str) -> str:
         try:
@@ -282,7 +286,7 @@ class SingleJobAnalysisAgent(Agent):
                 "Accept-Language": "en-US,en;q=0.9"
             }
             
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_client.get(url, headers=headers, timeout=15)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.text, "lxml")
@@ -413,7 +417,7 @@ class SingleJobAnalysisAgent(Agent):
                 'Upgrade-Insecure-Requests': '1'
             }
             
-            response = requests.get(url, headers=headers, timeout=15)
+            response = http_client.get(url, headers=headers, timeout=15)
             response.raise_for_status()
             
             if response.encoding is None:
@@ -534,6 +538,14 @@ class SingleJobAnalysisAgent(Agent):
             print(f"İçerik kalitesi çok düşük (skor: {content_quality:.2f}), template kullanılıyor...")
             return self.create_template_job_analysis(job_url)
         
+        # The prompt also shows the URL (company names are inferred from it),
+        # so it is part of the key; tracking parameters are dropped first.
+        cache_content = f"{normalize_job_url(job_url)}\n{job_description[:5000]}"
+        cached_job_data = llm_cache.get("job_analysis", cache_content, self.model.id, self.JOB_ANALYSIS_PROMPT_VERSION)
+        if cached_job_data:
+            print("♻️ Bu ilan daha önce analiz edilmiş, önbellekteki sonuç kullanılıyor...")
+            return self.save_job_analysis(dict(cached_job_data), job_url)
+
         print(f"✅ Kaliteli içerik tespit edildi (skor: {content_quality:.2f}), LLM analizi başlatılıyor...")
         analysis_prompt = f"""
         Sen bir uzman iş ilanı analistsin. Aşağıdaki metni dikkatli analiz et ve yapılandırılmış bilgileri çıkar.
@@ -593,18 +605,9 @@ class SingleJobAnalysisAgent(Agent):
                 response_content = response_content.split("```")[1].split("```")[0].strip()
             
             job_data = json.loads(response_content)
+            llm_cache.set("job_analysis", cache_content, self.model.id, self.JOB_ANALYSIS_PROMPT_VERSION, job_data)
             
-            job_data['job_url'] = job_url
-            
-            output_dir = Path(f"Jobs/Job_Analysis/")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_file_path = output_dir / f"{self.workflow_id}_single_job_analysis.json"
-
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                json.dump(job_data, f, ensure_ascii=False, indent=4)
-
-            print(f"İş ilanı analizi kaydedildi: {output_file_path}")
-            return f"İş ilanı başarıyla analiz edildi ve '{output_file_path}' konumuna kaydedildi."
+            return self.save_job_analysis(dict(job_data), job_url)
             
         except json.JSONDecodeError as e:
             print(f"JSON ayrıştırma hatası: {e}")
@@ -616,6 +619,15 @@ class SingleJobAnalysisAgent(Agent):
             print(f"İş ilanı analizi sırasında beklenmeyen hata: {e}")
             return f"Hata: İş ilanı analizi yapılamadı. Detaylar: {e}"
 
+    def save_job_analysis(self, job_data: dict, job_url: str) -> str:
+        job_data['job_url'] = job_url
+        
+        output_file_path = Path(f"Jobs/Job_Analysis/{self.workflow_id}_single_job_analysis.json")
+        self.artifact_store.put(output_file_path, job_data)
+
+        print(f"İş ilanı analizi kaydedildi: {output_file_path}")
+        return f"İş ilanı başarıyla analiz edildi ve '{output_file_path}' konumuna kaydedildi."
+
     def create_template_job_analysis(self, job_url: str) -> str:
         template_data = {
             "job_title": "Pozisyon Başlığı (Belirtilmemiş)",
@@ -629,15 +641,12 @@ class SingleJobAnalysisAgent(Agent):
             "employment_type": "Belirtilmemiş",
             "benefits": ["Yan haklar belirtilmemiş"],
             "job_url": job_url,
-            "note": "Bu bir template analizdir. İş ilanı otomatik olarak çekilemediği için genel bilgiler kullanıldı."
+            "note": "Bu bir template analizdir. İş ilanı otomatik olarak çekilemediği için genel bilgiler kullanıldı.",
+            "fallback": True
         }
         
-        output_dir = Path(f"Jobs/Job_Analysis/")
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_file_path = output_dir / f"{self.workflow_id}_single_job_analysis.json"
-
-        with open(output_file_path, 'w', encoding='utf-8') as f:
-            json.dump(template_data, f, ensure_ascii=False, indent=4)
+        output_file_path = Path(f"Jobs/Job_Analysis/{self.workflow_id}_single_job_analysis.json")
+        self.artifact_store.put(output_file_path, template_data)
 
         print(f"Template iş analizi kaydedildi: {output_file_path}")
         return f"İş ilanı çekilemedi, template analiz '{output_file_path}' konumuna kaydedildi." 
\ No newline at end of file
@@ -0,0 +1,136 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List
+
+
+def is_valid_artifact(path: Path) -> bool:
+    try:
+        if not path.exists() or path.stat().st_size == 0:
+            return False
+        if path.suffix == ".json":
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Template analyses written when an agent could not do the real work
+            # are kept for the report but must not be reused as checkpoints.
+            return bool(data) and not (isinstance(data, dict) and data.get("fallback"))
+        return bool(path.read_text(encoding="utf-8").strip())
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return False
+
+
+class WorkflowStep:
+    def __init__(self,
+                 name: str,
+                 action: Callable[[], str],
+                 outputs: List[Path],
+                 depends_on: Iterable[str] = (),
+                 failure_message: str = "",
+                 validate: Callable[[Path], bool] = is_valid_artifact):
+        self.name = name
+        self.action = action
+        self.outputs = outputs
+        self.depends_on = list(depends_on)
+        self.failure_message = failure_message or f"{name} adımı başarısız"
+        self.validate = validate
+
+    def is_complete(self) -> bool:
+        return all(self.validate(path) for path in self.outputs)
+
+
+class WorkflowEngine:
+    def __init__(self, steps: List[WorkflowStep]):
+        self.steps: Dict[str, WorkflowStep] = {step.name: step for step in steps}
+        self.order = self._topological_order()
+
+    async def run(self, force: Iterable[str] = ()) -> dict:
+        force = set(force)
+        results: Dict[str, str] = {}
+        skipped: List[str] = []
+        executed = set()
+        done = set()
+        pending = list(self.order)
+
+        while pending:
+            ready = [name for name in pending if all(dep in done for dep in self.steps[name].depends_on)]
+
+            # A checkpoint is only reusable if nothing it was built from was re-run.
+            reusable = [
+                name for name in ready
+                if name not in force
+                and not executed.intersection(self.steps[name].depends_on)
+                and self.steps[name].is_complete()
+            ]
+            for name in reusable:
+                print(f"⏭️ {name} adımı atlandı, mevcut çıktı kullanılıyor: {', '.join(map(str, self.steps[name].outputs))}")
+                results[name] = "Mevcut çıktı kullanıldı."
+                skipped.append(name)
+                done.add(name)
+                pending.remove(name)
+            if reusable:
+                continue
+
+            print(f"\n--- Adım başlatılıyor: {', '.join(ready)} ---")
+            step_results = await asyncio.gather(*(self._execute(self.steps[name]) for name in ready))
+            for name, result in zip(ready, step_results):
+                print(f"{name} sonucu: {result}")
+                results[name] = result
+                executed.add(name)
+                pending.remove(name)
+
+            failed = [name for name in ready if self._is_failure(results[name])]
+            if failed:
+                return self._report("failed", self.steps[failed[0]].failure_message, results, skipped)
+            done.update(ready)
+
+        return self._report("success", "Tüm iş akışı başarıyla tamamlandı.", results, skipped)
+
+    async def run_step(self, name: str) -> dict:
+        step = self.steps[name]
+        missing = [dep for dep in step.depends_on if not self.steps[dep].is_complete()]
+        if missing:
+            return self._report(
+                "failed", f"{name} için önceki adımların çıktıları eksik: {', '.join(missing)}", {}, []
+            )
+
+        print(f"\n--- Adım yeniden deneniyor: {name} ---")
+        result = await self._execute(step)
+        print(f"{name} sonucu: {result}")
+        if self._is_failure(result):
+            return self._report("failed", step.failure_message, {name: result}, [])
+        return self._report("success", f"{name} adımı başarıyla tamamlandı.", {name: result}, [])
+
+    async def _execute(self, step: WorkflowStep) -> str:
+        # Agent steps are blocking (HTTP + LLM calls); worker threads let
+        # independent steps overlap instead of running back to back.
+        try:
+            return await asyncio.to_thread(step.action)
+        except Exception as e:
+            return f"Hata: {step.name} adımı çalıştırılamadı. Detaylar: {e}"
+
+    def _is_failure(self, result: str) -> bool:
+        return "Hata:" in result
+
+    def _report(self, status: str, message: str, results: Dict[str, str], skipped: List[str]) -> dict:
+        return {"status": status, "message": message, "details": results, "skipped_steps": skipped}
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        visiting = set()
+
+        def visit(name: str) -> None:
+            if name in order:
+                return
+            if name in visiting:
+                raise ValueError(f"İş akışında döngüsel bağımlılık var: {name}")
+            if name not in self.steps:
+                raise ValueError(f"Tanımsız iş akışı adımı: {name}")
+            visiting.add(name)
+            for dep in self.steps[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            order.append(name)
+
+        for name in self.steps:
+            visit(name)
+        return order
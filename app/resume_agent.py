@@ -5,10 +5,10 @@ from pathlib import Path
 from textwrap import dedent
 
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
 from agno.tools.file import FileTools
 from agno.utils.log import logger
 from Tool.ResumeAnalysisToolkit import ResumeAnalysisToolkit
+from Tool.AgentPool import PooledOpenAIChat, agent_pool
 import dotenv
 import sys
 dotenv.load_dotenv()
@@ -106,7 +106,7 @@ async def create_resume_analysis_agent() -> Agent:
     """)
     
     return Agent(
-        model=OpenAIChat(id="gpt-4o"),
+        model=PooledOpenAIChat(id="gpt-4o"),
         tools=[resume_toolkit, file_toolkit],
         instructions=instructions,
         markdown=True,
@@ -117,9 +117,8 @@ async def run_agent(message: str) -> None:
     try:
         logger.info(f"Özgeçmiş analiz ajanı başlatılıyor: '{message}'")
         
-        agent = await create_resume_analysis_agent()
-        
-        await agent.aprint_response(message, stream=True)
+        async with agent_pool.session("resume_analysis", create_resume_analysis_agent) as agent:
+            await agent.aprint_response(message, stream=True)
                 
     except Exception as e:
         logger.error(f"Özgeçmiş analiz ajanı hatası: {e}")
@@ -866,6 +866,29 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+
+def show_workflow_result(coordinator, result: dict, job_url: str, resume_file_path: str):
+    st.session_state.last_workflow_id = coordinator.workflow_id
+
+    if result.get("status") == "success":
+        st.session_state.pop('failed_workflow', None)
+        st.session_state.workflow_completed = True
+        st.success("✅ İş akışı başarıyla tamamlandı!")
+        if result.get("skipped_steps"):
+            st.info(f"⏭️ Önceki çalışmadan yeniden kullanılan adımlar: {', '.join(result['skipped_steps'])}")
+    else:
+        st.session_state.failed_workflow = {
+            "workflow_id": coordinator.workflow_id,
+            "job_url": job_url,
+            "resume_file_path": resume_file_path,
+            "message": result.get("message", "")
+        }
+        st.error(f"❌ {result.get('message', 'İş akışı tamamlanamadı.')}")
+
+    results_display = MultiAgentResultsDisplay(coordinator.workflow_id)
+    results_display.display_results()
+
+
 if 'agent_manager' not in st.session_state:
     st.session_state.agent_manager = AgentManager()
 
@@ -1089,6 +1112,8 @@ elif selected_page_key == "multi_agent":
                 del st.session_state.workflow_completed
             if 'last_workflow_id' in st.session_state:
                 del st.session_state.last_workflow_id
+            if 'failed_workflow' in st.session_state:
+                del st.session_state.failed_workflow
             
             resume_save_path = Path("Jobs/Resumes") / uploaded_resume.name
             resume_save_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1107,13 +1132,8 @@ elif selected_page_key == "multi_agent":
                 result = asyncio.run(coordinator.run_full_workflow(job_url, str(resume_save_path)))
                 
                 progress_bar.progress(100)
-                status_text.success("✅ İş akışı başarıyla tamamlandı!")
-                
-                st.session_state.last_workflow_id = coordinator.workflow_id
-                st.session_state.workflow_completed = True
-                
-                results_display = MultiAgentResultsDisplay(coordinator.workflow_id)
-                results_display.display_results()
+                status_text.empty()
+                show_workflow_result(coordinator, result, job_url, str(resume_save_path))
 
             except Exception as e:
                 progress_bar.progress(0)
@@ -1133,6 +1153,17 @@ elif selected_page_key == "multi_agent":
                 - Internet bağlantınızı kontrol edin
                 """)
 
+        failed_workflow = st.session_state.get('failed_workflow')
+        if failed_workflow and not start_button:
+            st.warning(f"⚠️ Son iş akışı tamamlanamadı: {failed_workflow['message']}")
+            if st.button("🔁 Kaldığı Yerden Devam Et", use_container_width=True):
+                coordinator = CareerAgentTeamCoordinator(workflow_id=failed_workflow['workflow_id'])
+                with st.spinner("Tamamlanan adımlar atlanarak iş akışı sürdürülüyor..."):
+                    result = asyncio.run(coordinator.run_full_workflow(
+                        failed_workflow['job_url'], failed_workflow['resume_file_path']
+                    ))
+                show_workflow_result(coordinator, result, failed_workflow['job_url'], failed_workflow['resume_file_path'])
+
 
 def main():
     pass
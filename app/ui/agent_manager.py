@@ -1,3 +1,4 @@
+import uuid
 import asyncio
 from pathlib import Path
 from datetime import datetime
@@ -10,6 +11,7 @@ try:
     from ..cover_letter_agent_all import create_cover_letter_agent
     from ..agent_jobs_random_link import create_job_analysis_agent as create_random_job_agent
     from ..job_compatibility_agent import create_job_compatibility_agent
+    from ..Tool.AgentPool import agent_pool
 except ImportError:
     import sys
     import os
@@ -20,6 +22,16 @@ except ImportError:
     from cover_letter_agent_all import create_cover_letter_agent
     from agent_jobs_random_link import create_job_analysis_agent as create_random_job_agent
     from job_compatibility_agent import create_job_compatibility_agent
+    from Tool.AgentPool import agent_pool
+
+AGENT_FACTORIES = {
+    "linkedin_search": create_linkedin_agent,
+    "job_file_analyzer": create_job_file_analyzer_agent,
+    "resume_analysis": create_resume_analysis_agent,
+    "cover_letter": create_cover_letter_agent,
+    "job_url_analysis": create_random_job_agent,
+    "job_compatibility": create_job_compatibility_agent,
+}
 
 
 class AgentManager:
@@ -32,6 +44,9 @@ class AgentManager:
         for path in [self.job_results_path, self.resume_path, self.analysis_path, 
                     self.cover_letter_path, self.job_analysis_path]:
             path.mkdir(parents=True, exist_ok=True)
+        # One AgentManager lives in each Streamlit session; pooled agents run
+        # under this id so conversation state never crosses browser sessions.
+        self.session_id = str(uuid.uuid4())
     
     def _run_async(self, coro):
         try:
@@ -42,26 +57,8 @@ class AgentManager:
         
         return loop.run_until_complete(coro)
     
-    async def get_linkedin_agent(self):
-        return await create_linkedin_agent()
-    
-    async def get_job_analyzer_agent(self):
-        return await create_job_file_analyzer_agent()
-    
-    async def get_job_file_analyzer_agent(self):
-        return await create_job_file_analyzer_agent()
-    
-    async def get_resume_agent(self):
-        return await create_resume_analysis_agent()
-    
-    async def get_cover_letter_agent(self):
-        return await create_cover_letter_agent()
-    
-    async def get_random_job_agent(self):
-        return await create_random_job_agent()
-    
-    async def get_job_compatibility_agent(self):
-        return await create_job_compatibility_agent()
+    def agent_session(self, name: str):
+        return agent_pool.session(name, AGENT_FACTORIES[name], session_id=self.session_id)
     
     def get_available_job_files(self) -> list:
         try:
@@ -7,12 +7,10 @@ from datetime import datetime
 
 try:
     from .agent_manager import AgentManager
-    from ..job_compatibility_agent import create_job_compatibility_agent
 except ImportError:
     import sys
     sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
     from ui.agent_manager import AgentManager
-    from job_compatibility_agent import create_job_compatibility_agent
 
 
 class StreamlitJobCompatibilityTab:
@@ -230,7 +228,6 @@ class StreamlitJobCompatibilityTab:
                     )
                 
                 async def run_compatibility_analysis():
-                    agent = await create_job_compatibility_agent()
                     try:
                         import os
                         import locale
@@ -238,7 +235,8 @@ class StreamlitJobCompatibilityTab:
                         if os.name == 'nt':
                             os.environ['PYTHONIOENCODING'] = 'utf-8'
                         
-                        response = await agent.arun(message)
+                        async with self.agent_manager.agent_session("job_compatibility") as agent:
+                            response = await agent.arun(message)
                         response_content = response.content if hasattr(response, 'content') else str(response)
                         
                         if isinstance(response_content, str):
@@ -264,7 +264,7 @@ class StreamlitLinkedInTab:
         loop.close()
         return result
 
-    def search_linkedin_jobs(self, keyword, location, limit, date_filter):
+    def search_linkedin_jobs(self, keyword, location, limit, date_filter, incremental=False):
         if not keyword or not keyword.strip():
             st.error("❌ Lütfen bir anahtar kelime girin.")
             return
@@ -290,11 +290,17 @@ class StreamlitLinkedInTab:
                 search_results_raw = linkedin_toolkit.search_jobs(
                     command=f"{keyword} in {location}",
                     limit=limit,
-                    date_since_posted=date_filter
+                    date_since_posted=date_filter,
+                    concurrent_pages=1 if incremental else 4,
+                    incremental=incremental
                 )
                 
                 search_results = json.loads(search_results_raw)
                 
+                if incremental and not search_results.get("results"):
+                    st.info("ℹ️ Bu arama için daha önce görülmemiş yeni ilan bulunamadı.")
+                    return
+                
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"{keyword.lower().replace(' ', '_')}_{location.lower().replace(' ', '_')}_{timestamp}.json"
                 filepath = f"Jobs/Job_Results/{filename}"
@@ -448,6 +454,13 @@ class StreamlitLinkedInTab:
                 help="Çekilecek maksimum iş ilanı sayısı"
             )
         
+        incremental_search = st.checkbox(
+            label="🆕 Sadece yeni ilanlar",
+            value=False,
+            key="linkedin_incremental_search",
+            help="Bu arama için daha önce görülen ilanları atlar ve yalnızca yeni ilanları kaydeder"
+        )
+        
         st.markdown("</div>", unsafe_allow_html=True)
         
         col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
@@ -459,6 +472,6 @@ class StreamlitLinkedInTab:
                 if not final_keyword:
                     st.error("❌ Lütfen bir anahtar kelime girin.")
                 else:
-                    self.search_linkedin_jobs(final_keyword, final_location, limit_input, date_filter)
+                    self.search_linkedin_jobs(final_keyword, final_location, limit_input, date_filter, incremental_search)
 
  
\ No newline at end of file
@@ -11,7 +11,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from ui.agent_manager import AgentManager
 from ui.utils import UIUtils
-from resume_agent import create_resume_analysis_agent
+from app.multi_agent.ResumeIngestionPipeline import ResumeIngestionPipeline
 
 class StreamlitResumeAnalysisTab:
     def __init__(self, agent_manager: AgentManager):
@@ -43,7 +43,6 @@ class StreamlitResumeAnalysisTab:
                     f.write(uploaded_file.getbuffer())
                 
                 st.info(f"📁 Dosya kaydedildi: {saved_path}")
-                agent = self._run_async_in_thread(create_resume_analysis_agent())
                 base_name = Path(filename).stem
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 json_filename = f"resume_analysis_{base_name}_{timestamp}.json"
@@ -74,7 +73,11 @@ class StreamlitResumeAnalysisTab:
                                 
                 st.info("🤖 AI Agent başlatılıyor...")
                 
-                result = self._run_async_in_thread(agent.arun(analysis_query))
+                async def run_analysis():
+                    async with self.agent_manager.agent_session("resume_analysis") as agent:
+                        return await agent.arun(analysis_query)
+
+                result = self._run_async_in_thread(run_analysis())
                 
                 possible_patterns = [
                     f"resume_analysis_{base_name}_*.json",  
@@ -157,6 +160,23 @@ class StreamlitResumeAnalysisTab:
                 if 'resume_analysis_result' in st.session_state:
                     del st.session_state.resume_analysis_result
 
+    def ingest_resume_folder(self):
+        with st.spinner("📂 CV klasörü analiz ediliyor... Bu biraz zaman alabilir."):
+            try:
+                summary = self._run_async_in_thread(ResumeIngestionPipeline(resume_dir=str(self.resume_path)).run())
+            except Exception as e:
+                st.error(f"❌ Hata oluştu: {str(e)}")
+                return
+
+        if summary["status"] == "success":
+            st.success(f"✅ {summary['message']}")
+        else:
+            st.error(f"❌ {summary['message']}")
+        for name, error in summary["failed"].items():
+            st.warning(f"⚠️ {name}: {error}")
+        if summary["analysis_files"]:
+            st.json(summary["analysis_files"])
+
     def create_tab(self):
         st.header("📋 CV Analizi")
         st.markdown("CV'nizi yükleyin ve AI destekli detaylı analiz alın.")
@@ -171,4 +191,9 @@ class StreamlitResumeAnalysisTab:
             )
             
             if st.button("🔍 CV'yi Analiz Et", type="primary", use_container_width=True):
-                self.analyze_resume(uploaded_file)
\ No newline at end of file
+                self.analyze_resume(uploaded_file)
+
+        with col2:
+            st.markdown(f"📂 `{self.resume_path}` klasöründeki yeni veya değişmiş CV'leri toplu analiz edin.")
+            if st.button("📂 Klasördeki CV'leri Analiz Et", use_container_width=True):
+                self.ingest_resume_folder()
\ No newline at end of file
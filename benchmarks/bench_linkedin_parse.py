@@ -0,0 +1,57 @@
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "app"))
+
+from agno.utils.log import logger
+from Tool.LinkedInJobsToolkit import LinkedInJobsToolkit
+
+
+def time_parser(parse, pages: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            parse(html)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LinkedIn arama kartı ayrıştırma benchmark'ı (lxml vs BeautifulSoup)")
+    parser.add_argument("--fixtures", default=str(ROOT / "benchmarks" / "fixtures"), help="HTML fixture dizini")
+    parser.add_argument("--repeat", type=int, default=50, help="Her fixture için tekrar sayısı")
+    args = parser.parse_args()
+
+    logger.setLevel(logging.WARNING)
+
+    fixture_paths = sorted(Path(args.fixtures).glob("linkedin_search_page_*.html"))
+    if not fixture_paths:
+        print(f"Fixture bulunamadı: {args.fixtures}")
+        sys.exit(1)
+
+    pages = [path.read_text(encoding="utf-8") for path in fixture_paths]
+    toolkit = LinkedInJobsToolkit()
+
+    for path, html in zip(fixture_paths, pages):
+        lxml_jobs = toolkit._parse_job_list_lxml(html)
+        bs4_jobs = toolkit._parse_job_list_bs4(html)
+        if lxml_jobs != bs4_jobs:
+            print(f"❌ Çıktılar farklı: {path.name}")
+            sys.exit(1)
+
+    cards = sum(len(toolkit._parse_job_list_lxml(html)) for html in pages)
+    bs4_seconds = time_parser(toolkit._parse_job_list_bs4, pages, args.repeat)
+    lxml_seconds = time_parser(toolkit._parse_job_list_lxml, pages, args.repeat)
+    total_pages = len(pages) * args.repeat
+
+    print(f"Fixture: {len(pages)} sayfa, {cards} kart, {args.repeat} tekrar")
+    print(f"BeautifulSoup: {bs4_seconds:.3f} sn ({bs4_seconds / total_pages * 1000:.2f} ms/sayfa)")
+    print(f"lxml:          {lxml_seconds:.3f} sn ({lxml_seconds / total_pages * 1000:.2f} ms/sayfa)")
+    print(f"Hızlanma:      {bs4_seconds / lxml_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SMOKE = """
+import sys
+import app.multi_agent.CareerAgentTeamCoordinator
+import app.multi_agent.BatchCareerWorkflow
+import app.multi_agent.ResumeIngestionPipeline
+import resume_agent
+import job_details_agent
+
+import Tool.AgentPool
+import Tool.ContentCache
+import Tool.HttpClient
+import Tool.WebScraperToolkit
+import app.multi_agent.SingleJobAnalysisAgent as single_job
+import app.multi_agent.ResumeIngestionPipeline as pipeline
+
+assert not [name for name in sys.modules if name.startswith("app.Tool")], "Tool modules loaded twice"
+assert pipeline.agent_pool is Tool.AgentPool.agent_pool
+assert resume_agent.agent_pool is Tool.AgentPool.agent_pool
+assert sys.modules["Tool.DocumentTextExtractor"].cache is Tool.ContentCache.cache
+assert single_job.http_client is Tool.HttpClient.http_client is Tool.WebScraperToolkit.http_client
+"""
+
+
+def test_multi_agent_and_cli_agents_share_tool_modules():
+    # A fresh interpreter started from the repo root, as `python -m app...` is.
+    env = {**os.environ, "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "test")}
+    env.pop("PYTHONPATH", None)
+    result = subprocess.run(
+        [sys.executable, "-c", SMOKE],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr